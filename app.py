@@ -1,7 +1,6 @@
 """Entry point for the Podcastfy UI application."""
 
-from app import create_app
+from app import launch_app
 
 if __name__ == "__main__":
-    demo = create_app()
-    demo.launch(server_name="0.0.0.0")
+    launch_app()
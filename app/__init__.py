@@ -1,6 +1,6 @@
 """Podcastfy UI application package."""
 
-from .main import create_app
+from .main import create_app, launch_app
 
 __version__ = "0.1.0"
-__all__ = ["create_app"]
+__all__ = ["create_app", "launch_app"]
@@ -42,6 +42,10 @@ DATA_DIR = "data"
 AUDIO_DIR = f"{DATA_DIR}/audio"
 TRANSCRIPTS_DIR = f"{DATA_DIR}/transcripts"
 
+# Request queue settings
+QUEUE_CONCURRENCY_LIMIT = 4  # Generations processed in parallel
+QUEUE_MAX_SIZE = 32  # Requests allowed to wait in the queue
+
 # Content analysis thresholds
 CONTENT_LENGTH_THRESHOLDS = {
     'short': 1000,    # <1000 chars: 1-2 minutes
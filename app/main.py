@@ -21,6 +21,7 @@ from podcastfy.content_parser.content_extractor import ContentExtractor
 
 # Import utilities
 from .utils.directory import combine_directory_texts, is_text_directory
+from .config.settings import QUEUE_CONCURRENCY_LIMIT, QUEUE_MAX_SIZE
 
 def create_app():
     """Create and configure the Gradio interface."""
@@ -383,145 +384,135 @@ def create_app():
                 run_metadata["error_type"] = type(e).__name__
                 yield None, f"Error: {str(e)}", update_generation_progress(0, "Generation failed", 0)[0]
         
-        # Style events
-        style_components['style'].change(
-            fn=update_style_fields,
-            inputs=[style_components['style'], style_components['format_type']],
-            outputs=[
-                style_components['role1'],
-                style_components['role2'],
-                style_components['engagement']
-            ]
-        )
+        # Inputs shared by the transcript and podcast generation events
+        content_inputs = [
+            input_components['text_input'],
+            input_components['url_input'],
+            input_components['file_input'],
+            input_components['directory_input'],
+            input_components['recursive'],
+            input_components['file_types'],
+            style_components['format_type'],
+            style_components['style'],
+            style_components['creativity'],
+            style_components['podcast_name'],
+            style_components['podcast_tagline'],
+            style_components['dialogue_structure'],
+            style_components['role1'],
+            style_components['role2'],
+            style_components['engagement'],
+            style_components['user_instructions']
+        ]
+        longform_inputs = [
+            longform_components['longform_enabled'],
+            longform_components['chunk_size'],
+            longform_components['num_chunks']
+        ]
+        voice_outputs = [
+            voice_components['voice1'],
+            voice_components['voice2'],
+            voice_components['sample_btn'],
+            voice_components['sample_audio']
+        ]
         
-        # Longform events
-        chunk_config = longform_components['chunk_config']
-        chunk_config.change(
-            fn=update_chunk_sliders,
-            inputs=[chunk_config],
-            outputs=[
-                longform_components['chunk_size'],
-                longform_components['num_chunks']
-            ]
-        )
+        # Event manifest: (triggers, fn, inputs, outputs)
+        events = [
+            # Style events
+            (
+                [style_components['style'].change],
+                update_style_fields,
+                [style_components['style'], style_components['format_type']],
+                [
+                    style_components['role1'],
+                    style_components['role2'],
+                    style_components['engagement']
+                ]
+            ),
+            # Longform events
+            (
+                [longform_components['chunk_config'].change],
+                update_chunk_sliders,
+                [longform_components['chunk_config']],
+                [
+                    longform_components['chunk_size'],
+                    longform_components['num_chunks']
+                ]
+            ),
+            (
+                [longform_components['longform_enabled'].change],
+                toggle_longform_controls,
+                [longform_components['longform_enabled']],
+                [
+                    longform_components['chunk_config'],
+                    longform_components['chunk_size'],
+                    longform_components['num_chunks']
+                ]
+            ),
+            # Voice events: refresh voice choices when the model or format changes
+            (
+                [
+                    voice_components['tts_model'].change,
+                    style_components['format_type'].change
+                ],
+                update_voice_choices,
+                [voice_components['tts_model'], style_components['format_type']],
+                voice_outputs
+            ),
+            (
+                [voice_components['sample_btn'].click],
+                sample_voice,
+                [
+                    voice_components['voice1'],
+                    voice_components['voice2'],
+                    voice_components['tts_model'],
+                    style_components['format_type']
+                ],
+                [voice_components['sample_audio']]
+            ),
+            # Generate events
+            (
+                [generate_transcript_btn.click],
+                generate_transcript_interface,
+                content_inputs + longform_inputs,
+                [
+                    transcript_output,
+                    progress_components['stages']
+                ]
+            ),
+            (
+                [generate_btn.click],
+                generate_podcast_interface,
+                content_inputs + [
+                    voice_components['tts_model'],
+                    voice_components['voice1'],
+                    voice_components['voice2'],
+                    voice_components['output_language']
+                ] + longform_inputs,
+                [
+                    audio_output,
+                    transcript_output,
+                    progress_components['stages']  # Now contains both progress and status
+                ]
+            )
+        ]
         
-        longform_components['longform_enabled'].change(
-            fn=toggle_longform_controls,
-            inputs=[longform_components['longform_enabled']],
-            outputs=[
-                longform_components['chunk_config'],
-                longform_components['chunk_size'],
-                longform_components['num_chunks']
-            ]
-        )
-        
-        # Voice events
-        voice_components['tts_model'].change(
-            fn=update_voice_choices,
-            inputs=[
-                voice_components['tts_model'],
-                style_components['format_type']
-            ],
-            outputs=[
-                voice_components['voice1'],
-                voice_components['voice2'],
-                voice_components['sample_btn'],
-                voice_components['sample_audio']
-            ]
-        )
-        
-        voice_components['sample_btn'].click(
-            fn=sample_voice,
-            inputs=[
-                voice_components['voice1'],
-                voice_components['voice2'],
-                voice_components['tts_model'],
-                style_components['format_type']
-            ],
-            outputs=[voice_components['sample_audio']]
-        )
-
-        # Update voice components when format changes
-        style_components['format_type'].change(
-            fn=update_voice_choices,
-            inputs=[
-                voice_components['tts_model'],
-                style_components['format_type']
-            ],
-            outputs=[
-                voice_components['voice1'],
-                voice_components['voice2'],
-                voice_components['sample_btn'],
-                voice_components['sample_audio']
-            ]
-        )
-        
-        # Generate events
-        generate_transcript_btn.click(
-            fn=generate_transcript_interface,
-            inputs=[
-                input_components['text_input'],
-                input_components['url_input'],
-                input_components['file_input'],
-                input_components['directory_input'],
-                input_components['recursive'],
-                input_components['file_types'],
-                style_components['format_type'],
-                style_components['style'],
-                style_components['creativity'],
-                style_components['podcast_name'],
-                style_components['podcast_tagline'],
-                style_components['dialogue_structure'],
-                style_components['role1'],
-                style_components['role2'],
-                style_components['engagement'],
-                style_components['user_instructions'],
-                longform_components['longform_enabled'],
-                longform_components['chunk_size'],
-                longform_components['num_chunks']
-            ],
-            outputs=[
-                transcript_output,
-                progress_components['stages']
-            ]
-        )
-
-        generate_btn.click(
-            fn=generate_podcast_interface,
-            inputs=[
-                input_components['text_input'],
-                input_components['url_input'],
-                input_components['file_input'],
-                input_components['directory_input'],
-                input_components['recursive'],
-                input_components['file_types'],
-                style_components['format_type'],
-                style_components['style'],
-                style_components['creativity'],
-                style_components['podcast_name'],
-                style_components['podcast_tagline'],
-                style_components['dialogue_structure'],
-                style_components['role1'],
-                style_components['role2'],
-                style_components['engagement'],
-                style_components['user_instructions'],
-                voice_components['tts_model'],
-                voice_components['voice1'],
-                voice_components['voice2'],
-                voice_components['output_language'],
-                longform_components['longform_enabled'],
-                longform_components['chunk_size'],
-                longform_components['num_chunks']
-            ],
-            outputs=[
-                audio_output,
-                transcript_output,
-                progress_components['stages']  # Now contains both progress and status
-            ]
-        )
+        for triggers, fn, inputs, outputs in events:
+            gr.on(triggers=triggers, fn=fn, inputs=inputs, outputs=outputs)
+    
+    # Allow several generations to run at once; the LLM/TTS APIs are the bottleneck
+    demo.queue(default_concurrency_limit=QUEUE_CONCURRENCY_LIMIT, max_size=QUEUE_MAX_SIZE)
     
     return demo
 
-if __name__ == "__main__":
+def launch_app():
+    """Create the interface and serve it, using uvloop for the event loop when installed."""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     demo = create_app()
     demo.launch(server_name="0.0.0.0")
+
+if __name__ == "__main__":
+    launch_app()
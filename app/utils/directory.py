@@ -1,23 +1,39 @@
 """Directory handling utilities."""
 
 import os
-import re
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
-def natural_sort_key(s: str) -> List[str]:
-    """Key function for natural sorting of strings with numbers."""
-    return [int(text) if text.isdigit() else text.lower()
-            for text in re.split('([0-9]+)', s)]
+def natural_sort_key(s: str) -> List[Union[str, int]]:
+    """Key function for natural sorting of strings with numbers.
 
-def get_directory_text_files(directory_path: str) -> List[str]:
+    Scans the string once, alternating text and number runs. The key always
+    starts with a text run (possibly empty) so keys stay comparable.
     """
-    Get a list of text file paths from a directory, sorted naturally.
+    key = []
+    i, n = 0, len(s)
+    while i < n:
+        j = i
+        while j < n and not s[j].isdecimal():
+            j += 1
+        key.append(s[i:j].lower())
+        if j == n:
+            break
+        i = j
+        while j < n and s[j].isdecimal():
+            j += 1
+        key.append(int(s[i:j]))
+        i = j
+    return key
+
+def _scan_text_files(directory_path: str) -> List[os.DirEntry]:
+    """
+    Scan a directory for text file entries, sorted naturally by name.
     
     Args:
         directory_path (str): Path to directory containing text files
         
     Returns:
-        List[str]: List of absolute paths to text files, sorted naturally
+        List[os.DirEntry]: Text file entries with cached stat information
         
     Raises:
         ValueError: If directory doesn't exist or contains no text files
@@ -26,14 +42,29 @@ def get_directory_text_files(directory_path: str) -> List[str]:
         raise ValueError(f"Directory not found: {directory_path}")
     
     # Get all .txt files and sort them naturally
-    files = [f for f in os.listdir(directory_path) if f.endswith('.txt')]
-    if not files:
+    with os.scandir(directory_path) as it:
+        entries = [e for e in it if e.name.endswith('.txt')]
+    if not entries:
         raise ValueError(f"No text files found in directory: {directory_path}")
     
-    files.sort(key=natural_sort_key)
+    entries.sort(key=lambda e: natural_sort_key(e.name))
+    return entries
+
+def get_directory_text_files(directory_path: str) -> List[str]:
+    """
+    Get a list of text file paths from a directory, sorted naturally.
     
+    Args:
+        directory_path (str): Path to directory containing text files
+        
+    Returns:
+        List[str]: List of absolute paths to text files, sorted naturally
+        
+    Raises:
+        ValueError: If directory doesn't exist or contains no text files
+    """
     # Return absolute paths
-    return [os.path.abspath(os.path.join(directory_path, f)) for f in files]
+    return [os.path.abspath(e.path) for e in _scan_text_files(directory_path)]
 
 def combine_directory_texts(directory_path: str, max_size: int = 20_000_000) -> Tuple[str, bool]:
     """
@@ -50,24 +81,40 @@ def combine_directory_texts(directory_path: str, max_size: int = 20_000_000) ->
     Raises:
         ValueError: If directory doesn't exist or contains no text files
     """
-    file_paths = get_directory_text_files(directory_path)  # Already sorted naturally
-    file_paths.reverse()  # Most recent first
+    entries = _scan_text_files(directory_path)  # Already sorted naturally
+    entries.reverse()  # Most recent first
     
     combined = []
     total_size = 0
     truncated = False
     
-    for path in file_paths:
+    for entry in entries:
+        path = os.path.abspath(entry.path)
         try:
-            with open(path, 'r') as f:
-                content = f.read().strip()
-                if content:  # Only add non-empty content
-                    content_size = len(content.encode('utf-8'))  # Get size in bytes
-                    if total_size + content_size > max_size:
-                        truncated = True
-                        break
-                    combined.append(content)
-                    total_size += content_size
+            # Use the cached size to skip empty files and stop before opening
+            # a file that cannot fit in the remaining budget
+            entry_size = entry.stat().st_size
+            if entry_size == 0:
+                continue
+            if entry_size > max_size - total_size:
+                truncated = True
+                break
+            with open(path, 'rb') as f:
+                data = f.read()
+            text = data.decode('utf-8')
+            content = text.strip()
+            if not content:  # Only add non-empty content
+                continue
+            # Size in bytes, from the raw size less the stripped whitespace, so the
+            # content itself is not encoded again
+            start = len(text) - len(text.lstrip())
+            end = start + len(content)
+            content_size = len(data) - len(text[:start].encode('utf-8')) - len(text[end:].encode('utf-8'))
+            if total_size + content_size > max_size:
+                truncated = True
+                break
+            combined.append(content)
+            total_size += content_size
         except Exception as e:
             raise ValueError(f"Error reading file {path}: {str(e)}")
     
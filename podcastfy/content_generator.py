@@ -5,8 +5,18 @@ LangChain and various LLM backends. It handles the interaction with the AI model
 provides methods to generate and save the generated content.
 """
 
+import hashlib
+import io
+import json
 import os
-from typing import Optional, Dict, Any, List
+import asyncio
+import threading
+import time
+from array import array
+from collections import deque
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Coroutine, Iterator, Tuple
 import re
 
 from langchain_community.chat_models import ChatLiteLLM
@@ -14,19 +24,118 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_community.llms.llamafile import Llamafile
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.prompts import HumanMessagePromptTemplate
-from langchain import hub
+from langchain_core.prompts import HumanMessagePromptTemplate, SystemMessagePromptTemplate
+from langchain_core.messages import SystemMessage
 
 from podcastfy.utils.config_conversation import load_conversation_config
 from podcastfy.utils.config import load_config
-from podcastfy.templates import ConversationTemplate, MonologueTemplate
+from podcastfy.utils.cache import ResponseCache
 from podcastfy.templates.formats import get_template
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundary used when chunking long-form input: terminal punctuation and
+# whitespace, unless a lowercase letter or digit follows (e.g. "e.g. the", "No. 5")
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+(?![a-z0-9])')
+# Opening speaker tag (e.g. <Person1>) used to align long-form context on a turn
+_OPENING_TAG_RE = re.compile(r'<\w+>')
+
+
+def _run_sync(coro: Coroutine) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run when no event loop is running; otherwise (e.g. notebooks)
+    applies nest_asyncio so the running loop can be re-entered.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    import nest_asyncio
+    nest_asyncio.apply()
+    return loop.run_until_complete(coro)
+
+
+def _stream_text(chain, params: Dict[str, Any]) -> str:
+    """Run a chain in streaming mode and return the complete response.
+
+    Tokens are collected as the provider emits them, which keeps long
+    generations flowing over an open connection rather than waiting on one
+    large response, and lets progress be logged while the model is writing.
+    """
+    started = time.perf_counter()
+    pieces: List[str] = []
+    turns = 0
+    for piece in chain.stream(params):
+        if not pieces:
+            logger.debug("First tokens after %.2fs", time.perf_counter() - started)
+        pieces.append(piece)
+        if "</" in piece:
+            turns += piece.count("</")
+            logger.debug("Received ~%d tagged turns", turns)
+    return "".join(pieces)
+
+
+def _write_text_atomic(path: str, text: str) -> None:
+    """Write text to path atomically.
+
+    The text is encoded once and written to a temporary file in as few write
+    syscalls as possible, then renamed over the target, so readers never
+    observe a partially written file.
+    """
+    # Private to this process and thread, so concurrent writers never share a temp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=16)
+def _make_llm(
+    is_local: bool,
+    temperature: float,
+    max_output_tokens: int,
+    model_name: str,
+    api_key: Optional[str],
+):
+    """Create the LangChain client for a backend configuration.
+
+    Clients are cached so generators created with identical settings share
+    one client (and its HTTP connection pool) instead of rebuilding it.
+    """
+    if is_local:
+        return Llamafile()
+    if "gemini" in model_name.lower():
+        return ChatGoogleGenerativeAI(
+            api_key=api_key,
+            model=model_name,
+            max_output_tokens=max_output_tokens,
+            temperature=temperature,
+            presence_penalty=0.75,
+            frequency_penalty=0.75,
+        )
+    return ChatLiteLLM(
+        model=model_name,
+        temperature=temperature,
+        api_key=api_key,
+    )
+
+
 class LLMBackend:
     def __init__(
         self,
@@ -43,27 +152,85 @@ class LLMBackend:
         self.model_name = model_name
         self.is_multimodal = not is_local
 
-        common_params = {
-            "temperature": temperature,
-            "presence_penalty": 0.75,
-            "frequency_penalty": 0.75,
-        }
+        # Resolve the key here so a changed environment yields a fresh client
+        api_key = None
+        if not is_local:
+            if "gemini" in model_name.lower():
+                api_key_label = "GEMINI_API_KEY"
+            api_key = os.environ[api_key_label]
+        self.llm = _make_llm(is_local, temperature, max_output_tokens, model_name, api_key)
 
-        if is_local:
-            self.llm = Llamafile()
-        elif "gemini" in self.model_name.lower():
-            self.llm = ChatGoogleGenerativeAI(
-                api_key=os.environ["GEMINI_API_KEY"],
-                model=model_name,
-                max_output_tokens=max_output_tokens,
-                **common_params,
-            )
+
+class CachedChain:
+    """Wraps a prompt chain so repeated prompts are served from a ResponseCache."""
+
+    def __init__(self, prompt: ChatPromptTemplate, chain, cache: ResponseCache, namespace: str):
+        """Initialize the CachedChain.
+
+        Args:
+            prompt: Prompt template used to render the cache key
+            chain: Runnable producing the response (prompt | llm | parser)
+            cache: Response store
+            namespace: Identifies the model/settings the responses belong to
+        """
+        self.prompt = prompt
+        self.chain = chain
+        self.cache = cache
+        self.namespace = namespace
+
+    def _key(self, params: Dict[str, Any]) -> str:
+        """Compute the cache key for the fully rendered prompt."""
+        return self.cache.make_key(self.namespace, self.prompt.invoke(params).to_string())
+
+    def invoke(self, params: Dict[str, Any]) -> str:
+        """Return the cached response, invoking the chain on a miss."""
+        key = self._key(params)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.chain.invoke(params)
+            self.cache.set(key, response)
         else:
-            self.llm = ChatLiteLLM(
-                model=self.model_name,
-                temperature=temperature,
-                api_key=os.environ[api_key_label],
-            )
+            logger.info("Using cached LLM response")
+        return response
+
+    def stream(self, params: Dict[str, Any]) -> Iterator[str]:
+        """Stream the response, serving a cached one in a single piece."""
+        key = self._key(params)
+        response = self.cache.get(key)
+        if response is not None:
+            logger.info("Using cached LLM response")
+            yield response
+            return
+        pieces = []
+        for piece in self.chain.stream(params):
+            pieces.append(piece)
+            yield piece
+        self.cache.set(key, "".join(pieces))
+
+    async def ainvoke(self, params: Dict[str, Any]) -> str:
+        """Async variant of invoke."""
+        key = self._key(params)
+        response = self.cache.get(key)
+        if response is None:
+            response = await self.chain.ainvoke(params)
+            self.cache.set(key, response)
+        else:
+            logger.info("Using cached LLM response")
+        return response
+
+    async def abatch(self, params_list: List[Dict[str, Any]], config: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Batch variant of ainvoke; only cache misses are sent to the chain."""
+        keys = [self._key(params) for params in params_list]
+        responses = [self.cache.get(key) for key in keys]
+        misses = [i for i, response in enumerate(responses) if response is None]
+        if len(misses) < len(responses):
+            logger.info(f"Using {len(responses) - len(misses)} cached LLM responses")
+        if misses:
+            generated = await self.chain.abatch([params_list[i] for i in misses], config=config)
+            for i, response in zip(misses, generated):
+                responses[i] = response
+                self.cache.set(keys[i], response)
+        return responses
 
 
 class LongFormContentGenerator:
@@ -74,13 +241,44 @@ class LongFormContentGenerator:
     while generating longer conversations.
     """
     
-    def __init__(self, chain, llm, config_conversation: Dict[str, Any], template):
+    def __init__(self, chain, llm, config_conversation: Dict[str, Any], template,
+                 response_cache: Optional[ResponseCache] = None, cache_namespace: str = "",
+                 max_concurrency: int = 8):
         """Initialize LongFormContentGenerator."""
+        self.max_concurrency = max_concurrency
         self.llm_chain = chain
         self.llm = llm
         self.template = template
+        self.response_cache = response_cache
+        self.cache_namespace = cache_namespace
+        # Format instructions are static, resolve them once
+        self._format_instructions = template.get_longform_instructions()
+        self.chunk_chain = self._build_chunk_chain()
         self.max_num_chunks = config_conversation.get("max_num_chunks", 7)
         self.min_chunk_size = config_conversation.get("min_chunk_size", 600)
+        self.parallel_chunks = config_conversation.get("parallel_chunks", False)
+        self.context_tail_chars = config_conversation.get("context_tail_chars", 800)
+        # Chunk-specific rules are static; only the first chunk's need formatting
+        self._first_chunk_rules_template = """
+            1. Start with: Welcome to {podcast_name} - {podcast_tagline}.
+            2. Begin discussing the content.
+            3. End with an open-ended question or statement that leads into the next topic.
+            4. DO NOT end with any farewells or thank yous.
+            """
+        self._last_chunk_rules = """
+            1. Continue the previous discussion naturally.
+            2. End with a brief thank you to the listeners.
+            """
+        self._middle_chunk_rules = """
+            1. Continue the conversation exactly where it left off.
+            2. Respond directly to the last speaker's points.
+            3. End with an open-ended question or statement that leads into the next topic.
+            4. DO NOT:
+               - Introduce yourself or the podcast
+               - End with any farewells or thank yous.
+               - Mention PODCASTIFY
+               - Add any transitional phrases like "moving on" or "next"
+            """
 
     def __calculate_chunk_size(self, input_content: str) -> int:
         """Calculate chunk size based on input content length."""
@@ -94,25 +292,72 @@ class LongFormContentGenerator:
         
         return input_length // (input_length // self.min_chunk_size)
 
-    def chunk_content(self, input_content: str, chunk_size: int) -> List[str]:
-        """Split input content into manageable chunks while preserving context."""
-        sentences = input_content.split('. ')
-        chunks = []
-        current_chunk = []
-        current_length = 0
+    @staticmethod
+    def _sentence_offsets(input_content: str) -> Tuple[array, array]:
+        """Return the start and end offsets of each sentence as compact integer arrays."""
+        starts, ends = array('q'), array('q')
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(input_content):
+            starts.append(start)
+            ends.append(match.start() + 1)  # Keep the punctuation
+            start = match.end()
+        if start < len(input_content):
+            starts.append(start)
+            ends.append(len(input_content))
+        return starts, ends
+
+    def _iter_chunk_spans(self, input_content: str, chunk_size: int) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of each chunk in the input.
         
-        for sentence in sentences:
-            sentence_length = len(sentence)
-            if current_length + sentence_length > chunk_size and current_chunk:
-                chunks.append('. '.join(current_chunk) + '.')
-                current_chunk = []
-                current_length = 0
-            current_chunk.append(sentence)
-            current_length += sentence_length
-            
-        if current_chunk:
-            chunks.append('. '.join(current_chunk) + '.')
-        return chunks
+        Sentence ends are increasing, so the last sentence that fits in a chunk
+        is found by bisection rather than by stepping through every sentence.
+        """
+        starts, ends = self._sentence_offsets(input_content)
+        i, n = 0, len(starts)
+        while i < n:
+            # A chunk always takes at least one sentence, even an oversized one
+            last = max(bisect_right(ends, starts[i] + chunk_size, i) - 1, i)
+            yield starts[i], ends[last]
+            i = last + 1
+
+    @staticmethod
+    def _chunk_digest(chunk: str) -> bytes:
+        """Digest identifying a chunk's text, used to detect repeated chunks."""
+        return hashlib.blake2b(chunk.encode('utf-8'), digest_size=16).digest()
+
+    def chunk_content(self, input_content: str, chunk_size: int) -> Iterator[str]:
+        """Split input content into manageable chunks while preserving context.
+        
+        Sentences are located in a single pass and chunks are yielded lazily as
+        slices of the original string, so no intermediate lists are built.
+        """
+        for start, end in self._iter_chunk_spans(input_content, chunk_size):
+            yield input_content[start:end]
+
+    def _context_tail(self, response: str) -> str:
+        """Return the end of a response to use as context for the next chunk.
+        
+        Only the last context_tail_chars characters are kept, so prompt size
+        does not grow with response length. The tail starts at a speaker tag
+        when one is present, so the model never sees a partial turn.
+        """
+        if len(response) <= self.context_tail_chars:
+            return response
+        tail = response[-self.context_tail_chars:]
+        match = _OPENING_TAG_RE.search(tail)
+        return tail[match.start():] if match else tail
+
+    def _source_excerpt_context(self, previous_chunk: str) -> str:
+        """Return context for a middle chunk generated before its predecessor's response.
+        
+        The context is the end of the preceding source chunk, not conversation, so
+        it is labelled as such; otherwise the model treats it as lines to respond to.
+        """
+        excerpt = previous_chunk[-self.context_tail_chars:]
+        return (
+            "No conversation is available for the previous part yet. "
+            f"Preceding source excerpt, covered by the previous part: {excerpt}"
+        )
 
     def enhance_prompt_params(self, prompt_params: Dict, 
                             part_idx: int, 
@@ -121,43 +366,41 @@ class LongFormContentGenerator:
                             chunk: str) -> Dict:
         """Enhance prompt parameters for content generation."""
 
-        enhanced_params = prompt_params.copy()
-        enhanced_params["context"] = chat_context
-
-        # Get format-specific longform instructions
-        format_instructions = self.template.get_longform_instructions()
-
         # Determine chunk-specific instructions
         if part_idx == 0:
-            chunk_rules = f"""
-            1. Start with: Welcome to {enhanced_params["podcast_name"]} - {enhanced_params["podcast_tagline"]}.
-            2. Begin discussing the content.
-            3. End with an open-ended question or statement that leads into the next topic.
-            4. DO NOT end with any farewells or thank yous.
-            """
+            chunk_rules = self._first_chunk_rules_template.format_map(prompt_params)
         elif part_idx == total_parts - 1:
-            chunk_rules = """
-            1. Continue the previous discussion naturally.
-            2. End with a brief thank you to the listeners.
-            """
+            chunk_rules = self._last_chunk_rules
         else:
-            chunk_rules = """
-            1. Continue the conversation exactly where it left off.
-            2. Respond directly to the last speaker's points.
-            3. End with an open-ended question or statement that leads into the next topic.
-            4. DO NOT:
-               - Introduce yourself or the podcast
-               - End with any farewells or thank yous.
-               - Mention PODCASTIFY
-               - Add any transitional phrases like "moving on" or "next"
-            """
+            chunk_rules = self._middle_chunk_rules
+
+        # Build the per-chunk params in one pass; only the short per-chunk values
+        # are added, the chunk prompt renders the rest
+        return {
+            **prompt_params,
+            "context": chat_context,
+            "input_text": chunk,
+            "chunk_text": chunk,
+            "part_number": part_idx + 1,
+            "total_parts": total_parts,
+            "prev_context": chat_context if chat_context else "No previous context - this is the start",
+            "chunk_rules": chunk_rules,
+            "chunk_preview": chunk[:200],
+        }
 
-        enhanced_params["instruction"] = f"""
+    def _build_chunk_chain(self):
+        """Build the chain shared by all chunks.
+        
+        The instruction scaffold lives in the prompt, with the static format
+        instructions bound up front, so each chunk only supplies a few short
+        values and the prompt is rendered in a single pass.
+        """
+        instruction_template = """
         {format_instructions}
 
-        IMPORTANT: You are generating part {part_idx + 1} of {total_parts}. 
+        IMPORTANT: You are generating part {part_number} of {total_parts}. 
         
-        Previous context: {chat_context if chat_context else "No previous context - this is the start"}
+        Previous context: {prev_context}
         
         Rules for this part:
         {chunk_rules}
@@ -166,16 +409,24 @@ class LongFormContentGenerator:
         1. Use the previous context to maintain conversation flow.
         2. Each speaker must respond to what was previously said.
         3. NO meta-commentary about parts or segments.
-        4. ONLY discuss the content from this section: {chunk[:200]}...
+        4. ONLY discuss the content from this section: {chunk_preview}...
         """
-        
-        return enhanced_params
+        prompt = ChatPromptTemplate.from_messages([
+            SystemMessagePromptTemplate.from_template(instruction_template),
+            HumanMessagePromptTemplate.from_template(
+                "Please analyze this input and generate a conversation. {chunk_text}"
+            )
+        ]).partial(format_instructions=self._format_instructions)
+        chain = prompt | self.llm | StrOutputParser()
+        if self.response_cache:
+            return CachedChain(prompt, chain, self.response_cache, self.cache_namespace)
+        return chain
 
     def generate_long_form(self, input_content: str, prompt_params: Dict) -> str:
         """Generate a complete long-form conversation using chunked content.
         
         This version maintains conversation flow by:
-        1. Using minimal context (only previous response)
+        1. Using minimal context (only the end of the previous response)
         2. Avoiding redundant introductions/farewells
         3. Ensuring proper speaker alternation
         
@@ -188,31 +439,44 @@ class LongFormContentGenerator:
             
         Implementation Notes:
         - chat_context starts empty (not full input_content)
-        - Each chunk only sees previous response as context
+        - Each chunk only sees the tail of the previous response as context
         - Chunks are processed sequentially with minimal context
         - First chunk handles introduction
         - Middle chunks continue naturally
         - Last chunk handles conclusion
+        - When parallel_chunks is enabled, generation is delegated to
+          agenerate_long_form instead
         """
-        # Log initial state
-        print("\n=== Long Form Generation ===")
+        if self.parallel_chunks:
+            return _run_sync(self.agenerate_long_form(input_content, prompt_params))
+
+        logger.debug("=== Long Form Generation ===")
         
         # Calculate appropriate chunk size
         chunk_size = self.__calculate_chunk_size(input_content)
-        chunks = self.chunk_content(input_content, chunk_size)
-        num_parts = len(chunks)
-        print(f"Chunks: {num_parts}, size {chunk_size}")
+        # Locate the parts up front so chunk text itself can be sliced lazily
+        chunk_spans = list(self._iter_chunk_spans(input_content, chunk_size))
+        num_parts = len(chunk_spans)
+        logger.debug("Chunks: %d, size %d", num_parts, chunk_size)
         
-        # Track conversation pieces
-        conversation_parts = []
+        # Buffer conversation pieces and stringify once at the end
+        buf = io.StringIO()
         chat_context = ""  # Start with empty context
+        # Rolling window of recent responses; older ones never reach the prompt
+        recent_responses = deque(maxlen=2)
+        seen_chunks = set()
         
-        for i, chunk in enumerate(chunks):
-            print(f"Processing chunk {i+1}/{num_parts}")
+        for i, (start, end) in enumerate(chunk_spans):
+            logger.debug("Processing chunk %d/%d", i + 1, num_parts)
+            chunk = input_content[start:end]
             
-            # For middle and end parts, use only previous response as context
-            if i > 0:
-                chat_context = conversation_parts[-1]
+            # Repeated middle chunks (e.g. boilerplate) were already discussed
+            if 0 < i < num_parts - 1:
+                digest = self._chunk_digest(chunk)
+                if digest in seen_chunks:
+                    logger.debug("Skipping duplicate chunk %d/%d", i + 1, num_parts)
+                    continue
+                seen_chunks.add(digest)
             
             # Prepare parameters for this chunk
             enhanced_params = self.enhance_prompt_params(
@@ -222,22 +486,77 @@ class LongFormContentGenerator:
                 chat_context=chat_context,
                 chunk=chunk
             )
-            enhanced_params["input_text"] = chunk
             
             # Generate response for this chunk
-            chain = ChatPromptTemplate.from_messages([
-                SystemMessage(content=enhanced_params["instruction"]),
-                HumanMessage(content=f"Please analyze this input and generate a conversation. {chunk}")
-            ]) | self.llm | StrOutputParser()
-            # Remove instruction from params since it's now in the system message
-            params_without_instruction = {k: v for k, v in enhanced_params.items() if k != "instruction"}
-            response = chain.invoke(params_without_instruction)
+            response = self.chunk_chain.invoke(enhanced_params)
             
-            conversation_parts.append(response)
+            buf.write(response)
+            buf.write("\n")
+            # Next part sees only the bounded tail of the recent responses, so
+            # per-chunk context stays constant no matter how many parts came before
+            recent_responses.append(response)
+            chat_context = self._context_tail("\n".join(recent_responses))
         
-        # Combine all parts into final conversation
-        final_conversation = "\n".join(conversation_parts)
-        return final_conversation
+        return buf.getvalue().rstrip("\n")
+
+    async def agenerate_long_form(self, input_content: str, prompt_params: Dict) -> str:
+        """Generate a long-form conversation with middle chunks generated concurrently.
+        
+        The introduction is generated first and the conclusion last, each seeing
+        the tail of the response before it. Middle chunks cannot wait for one
+        another, so they use a labelled excerpt of the preceding source chunk as
+        context (the first one uses the introduction) and run at most
+        max_concurrency at a time.
+        
+        Args:
+            input_content (str): Input text to be chunked and processed
+            prompt_params (Dict): Base parameters for prompt generation
+            
+        Returns:
+            str: Complete generated conversation, parts in input order
+        """
+        chunk_size = self.__calculate_chunk_size(input_content)
+        chunks = list(self.chunk_content(input_content, chunk_size))
+        num_parts = len(chunks)
+        logger.info(f"Generating {num_parts} long-form chunks concurrently (size {chunk_size})")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _generate_chunk(i: int, chat_context: str) -> str:
+            chunk = chunks[i]
+            enhanced_params = self.enhance_prompt_params(
+                prompt_params,
+                part_idx=i,
+                total_parts=num_parts,
+                chat_context=chat_context,
+                chunk=chunk
+            )
+            async with semaphore:
+                return await self.chunk_chain.ainvoke(enhanced_params)
+
+        # Introduction first, so the middle chunks can follow on from it
+        intro = await _generate_chunk(0, "")
+        if num_parts == 1:
+            return intro
+
+        # Repeated middle chunks (e.g. boilerplate) are only generated once
+        seen_chunks = set()
+        middle_indices = []
+        for i in range(1, num_parts - 1):
+            digest = self._chunk_digest(chunks[i])
+            if digest not in seen_chunks:
+                seen_chunks.add(digest)
+                middle_indices.append(i)
+
+        intro_context = self._context_tail(intro)
+        middle_parts = await asyncio.gather(*(
+            _generate_chunk(i, intro_context if i == 1 else self._source_excerpt_context(chunks[i - 1]))
+            for i in middle_indices
+        ))
+
+        # Conclusion last, following on from the final middle response
+        previous = middle_parts[-1] if middle_parts else intro
+        outro = await _generate_chunk(num_parts - 1, self._context_tail(previous))
+        return "\n".join([intro, *middle_parts, outro])
 
 
 class ContentGenerator:
@@ -258,8 +577,8 @@ class ContentGenerator:
         # Get output directories
         self.output_directories = self.config_conversation.get("text_to_speech", {}).get("output_directories", {})
         transcripts_dir = self.output_directories.get("transcripts")
-        if transcripts_dir and not os.path.exists(transcripts_dir):
-            os.makedirs(transcripts_dir)
+        if transcripts_dir:
+            os.makedirs(transcripts_dir, exist_ok=True)
         
         # Initialize LLM backend
         if not model_name:
@@ -275,6 +594,19 @@ class ContentGenerator:
             api_key_label=api_key_label,
         )
         self.llm = llm_backend.llm
+        # Anthropic models (directly or through LiteLLM) accept explicit cache breakpoints
+        self._supports_cache_control = not is_local and any(
+            name in model_name.lower() for name in ("claude", "anthropic")
+        )
+        
+        # Optional persistent cache of LLM responses
+        self.response_cache = None
+        self.cache_namespace = f"{model_name}|{llm_backend.temperature}"
+        cache_config = self.content_generator_config.get("response_cache", {})
+        if cache_config.get("enabled", False):
+            self.response_cache = ResponseCache(
+                cache_config.get("path", "data/cache/llm_responses.sqlite")
+            )
         
         # Set format type
         if not format_type:
@@ -283,17 +615,25 @@ class ContentGenerator:
         
         # Initialize template
         self.template = get_template(format_type)()
+        self._template_str = self.template.get_template()
+        self._user_text_prefix = (
+            "Please analyze this input and generate a monologue using <Speaker> tags for all speech. "
+            if format_type == "monologue"
+            else "Please analyze this input and generate a conversation. "
+        )
+        
+        # Composed prompts keyed by (num_images, format_type, config fingerprint)
+        self._prompt_cache: Dict[Tuple[int, str, str], Tuple[ChatPromptTemplate, List[str]]] = {}
 
     def __compose_prompt(self, num_images: int) -> ChatPromptTemplate:
-        """Compose the prompt for the LLM."""
-        image_path_keys = []
-        messages = []
-
-        # Get format-specific template
-        template_str = self.template.get_template()
+        """Compose the prompt for the LLM.
         
-        # Create system message with format requirements
-        system_content = template_str
+        The system instructions depend only on the conversation config, so they
+        are rendered here into a literal system message that forms an identical
+        prefix for every request. Providers with prompt caching can then reuse it.
+        """
+        # Get format-specific template
+        template_str = self._template_str
         
         # Add style parameters as system instructions
         style_instructions = """
@@ -310,44 +650,138 @@ Content Instructions:
 5. Use evidence and examples from the provided content
 
 The podcast should be titled "{podcast_name}" with the tagline "{podcast_tagline}"."""
-        system_content = f"{system_content}\n\n{style_instructions}"
+        config_conversation = self.config_conversation
+        style_instructions = style_instructions.format(
+            conversation_style=", ".join(config_conversation.get("conversation_style", [])),
+            dialogue_structure=", ".join(config_conversation.get("dialogue_structure", [])),
+            engagement_techniques=", ".join(config_conversation.get("engagement_techniques", [])),
+            podcast_name=config_conversation.get("podcast_name"),
+            podcast_tagline=config_conversation.get("podcast_tagline"),
+        )
+
+        # Static prefix: format requirements and style parameters
+        static_block = {"type": "text", "text": "\n\n".join([template_str, style_instructions])}
+        if self._supports_cache_control:
+            static_block["cache_control"] = {"type": "ephemeral"}
+        system_blocks = [static_block]
 
-        # Add any user instructions
-        user_instructions = self.config_conversation.get("user_instructions", "")
+        # Add any user instructions after the cacheable prefix
+        user_instructions = config_conversation.get("user_instructions", "")
         if user_instructions:
-            system_content = f"{system_content}\n\nAdditional Instructions:\n{user_instructions}"
+            system_blocks.append(
+                {"type": "text", "text": f"\n\nAdditional Instructions:\n{user_instructions}"}
+            )
         
-        # Create list of message dicts
-        messages = [
-            # System message as dict
-            {
-                "type": "system",
-                "text": system_content
-            },
-            # Text content as dict with format-specific prompt
-            {
-                "type": "text",
-                "text": ("Please analyze this input and generate a monologue using <Speaker> tags for all speech. " if self.format_type == "monologue" else "Please analyze this input and generate a conversation. ") + "{input_text}",
-            }
-        ]
-
-        # Add image content if any
-        for i in range(num_images):
-            key = f"image_path_{i}"
-            image_content = {
-                "type": "image_url",
-                "image_url": {"url": "{" + key + "}", "detail": "high"}
-            }
-            image_path_keys.append(key)
-            messages.append(image_content)
-
-        # Create template from message dicts
+        user_text = self._user_text_prefix + "{input_text}"
+        image_path_keys = [f"image_path_{i}" for i in range(num_images)]
+        if image_path_keys:
+            # Text content followed by one image block per image
+            user_message = HumanMessagePromptTemplate.from_template(
+                [{"type": "text", "text": user_text}]
+                + [
+                    {"type": "image_url", "image_url": {"url": "{" + key + "}", "detail": "high"}}
+                    for key in image_path_keys
+                ]
+            )
+        else:
+            # Text-only input (the common case) needs no content-block list
+            user_message = HumanMessagePromptTemplate.from_template(user_text)
+
+        # Only send content blocks where the cache breakpoint is understood
+        if self._supports_cache_control:
+            system_message = SystemMessage(content=system_blocks)
+        else:
+            system_message = SystemMessage(content="".join(block["text"] for block in system_blocks))
+
+        # Create template from the system message and user message dicts
         user_prompt_template = ChatPromptTemplate.from_messages(
-            messages=[HumanMessagePromptTemplate.from_template(messages)]
+            messages=[
+                system_message,
+                user_message,
+            ]
         )
 
         return user_prompt_template, image_path_keys
 
+    def _config_fingerprint(self) -> str:
+        """Digest of the conversation config, used to key anything derived from it."""
+        return hashlib.blake2b(
+            json.dumps(self.config_conversation, sort_keys=True, default=str).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def _get_prompt(self, num_images: int) -> Tuple[ChatPromptTemplate, List[str]]:
+        """Return the composed prompt for num_images, composing it only on first use.
+        
+        The system prompt is rendered from the conversation config, so the key
+        includes a fingerprint of it and any config change composes afresh.
+        """
+        key = (num_images, self.format_type, self._config_fingerprint())
+        if key not in self._prompt_cache:
+            self._prompt_cache[key] = self.__compose_prompt(num_images)
+        return self._prompt_cache[key]
+
+    def _build_chain(self, num_images: int) -> Tuple[Any, List[str]]:
+        """Build the generation chain for num_images images, wrapped in the response cache if enabled."""
+        self.prompt_template, image_path_keys = self._get_prompt(num_images)
+        self.parser = StrOutputParser()
+        chain = self.prompt_template | self.llm | self.parser
+        if self.response_cache:
+            chain = CachedChain(
+                self.prompt_template, chain, self.response_cache, self.cache_namespace
+            )
+        return chain, image_path_keys
+
+    def _build_prompt_params(
+        self, input_texts: str, image_path_keys: List[str], image_file_paths: List[str]
+    ) -> Dict[str, Any]:
+        """Build the prompt parameters for one input."""
+        # Clean input text
+        cleaned_input = input_texts.strip()
+        if "{input_text}" in cleaned_input:
+            cleaned_input = cleaned_input.replace("{input_text}", "").strip()
+        
+        # Prepare parameters
+        config_conversation = self.config_conversation
+        prompt_params = {
+            "input_text": cleaned_input,
+            "conversation_style": ", ".join(
+                config_conversation.get("conversation_style", [])
+            ),
+            "dialogue_structure": ", ".join(
+                config_conversation.get("dialogue_structure", [])
+            ),
+            "podcast_name": config_conversation.get("podcast_name"),
+            "podcast_tagline": config_conversation.get("podcast_tagline"),
+            "output_language": config_conversation.get("output_language"),
+            "engagement_techniques": ", ".join(
+                config_conversation.get("engagement_techniques", [])
+            ),
+            "user_instructions": config_conversation.get("user_instructions", "")
+        }
+
+        # Add image paths if any
+        for key, path in zip(image_path_keys, image_file_paths):
+            prompt_params[key] = path
+        return prompt_params
+
+    def _transcript_key(self, cleaned_input: str, image_file_paths: List[str], longform: bool) -> str:
+        """Cache key for a finished transcript.
+        
+        The input is whitespace-normalized so reruns on re-extracted content
+        still hit, and the whole conversation config is part of the key so any
+        setting change produces a new transcript.
+        """
+        return self.response_cache.make_key(
+            "transcript",
+            self.cache_namespace,
+            self.format_type,
+            "longform" if longform else "standard",
+            self._config_fingerprint(),
+            *image_file_paths,
+            " ".join(cleaned_input.split()),
+        )
+
     def generate_qa_content(
         self,
         input_texts: str = "",
@@ -362,58 +796,55 @@ The podcast should be titled "{podcast_name}" with the tagline "{podcast_tagline
 
             # Setup chain
             num_images = 0 if self.is_local else len(image_file_paths)
-            self.prompt_template, image_path_keys = self.__compose_prompt(num_images)
-            self.parser = StrOutputParser()
-            self.chain = self.prompt_template | self.llm | self.parser
+            self.chain, image_path_keys = self._build_chain(num_images)
 
-            # Clean input text
-            cleaned_input = input_texts.replace("{input_text}", "").strip()
-            
-            # Prepare parameters
-            prompt_params = {
-                "input_text": cleaned_input,
-                "conversation_style": ", ".join(
-                    self.config_conversation.get("conversation_style", [])
-                ),
-                "dialogue_structure": ", ".join(
-                    self.config_conversation.get("dialogue_structure", [])
-                ),
-                "podcast_name": self.config_conversation.get("podcast_name"),
-                "podcast_tagline": self.config_conversation.get("podcast_tagline"),
-                "output_language": self.config_conversation.get("output_language"),
-                "engagement_techniques": ", ".join(
-                    self.config_conversation.get("engagement_techniques", [])
-                ),
-                "user_instructions": self.config_conversation.get("user_instructions", "")
-            }
-
-            # Add image paths if any
-            for key, path in zip(image_path_keys, image_file_paths):
-                prompt_params[key] = path
+            prompt_params = self._build_prompt_params(input_texts, image_path_keys, image_file_paths)
+            cleaned_input = prompt_params["input_text"]
 
             # Log prompt parameters
             logger.info(f"Generating content with format: {self.format_type}")
-            logger.info(f"Input text (first 500 chars): {input_texts[:500]}...")
-            logger.info(f"Parameters: {prompt_params}")
-
-            # Generate content
-            if longform:
-                generator = LongFormContentGenerator(self.chain, self.llm, self.config_conversation, self.template)
-                self.response = generator.generate_long_form(cleaned_input, prompt_params)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Input text (first 500 chars): %s...", input_texts[:500])
+                # Leave out the full input text, which can be megabytes long
+                logger.debug(
+                    "Parameters: %s",
+                    {k: v for k, v in prompt_params.items() if k != "input_text"}
+                )
+
+            # Reuse a finished transcript for the same input and settings
+            transcript_key = None
+            cached_transcript = None
+            if self.response_cache:
+                transcript_key = self._transcript_key(cleaned_input, image_file_paths, longform)
+                cached_transcript = self.response_cache.get(transcript_key)
+
+            if cached_transcript is not None:
+                logger.info("Using cached transcript")
+                self.response = cached_transcript
             else:
-                self.response = self.chain.invoke(prompt_params)
-            logger.info(f"Raw LLM response (first 500 chars): {self.response[:500]}...")
-
-            # Clean response
-            self.response = self.template.clean_markup(self.response)
-            logger.info(f"Cleaned response (first 500 chars): {self.response[:500]}...")
+                # Generate content
+                if longform:
+                    generator = LongFormContentGenerator(
+                        self.chain, self.llm, self.config_conversation, self.template,
+                        response_cache=self.response_cache, cache_namespace=self.cache_namespace,
+                        max_concurrency=self.content_generator_config.get("max_concurrency", 8)
+                    )
+                    self.response = generator.generate_long_form(cleaned_input, prompt_params)
+                else:
+                    self.response = _stream_text(self.chain, prompt_params)
+                logger.info(f"Raw LLM response (first 500 chars): {self.response[:500]}...")
+
+                # Clean response
+                self.response = self.template.clean_markup(self.response)
+                logger.info(f"Cleaned response (first 500 chars): {self.response[:500]}...")
+                if transcript_key:
+                    self.response_cache.set(transcript_key, self.response)
                 
             logger.info("Content generated successfully")
 
             # Save output if requested
             if output_filepath:
-                with open(output_filepath, "w") as file:
-                    file.write(self.response)
+                _write_text_atomic(output_filepath, self.response)
                 logger.info(f"Response content saved to {output_filepath}")
                 print(f"Transcript saved to {output_filepath}")
 
@@ -422,3 +853,74 @@ The podcast should be titled "{podcast_name}" with the tagline "{podcast_tagline
         except Exception as e:
             logger.error(f"Error generating content: {str(e)}")
             raise
+
+    def generate_qa_batch(
+        self,
+        inputs: List[str],
+        image_file_paths_list: Optional[List[List[str]]] = None,
+        max_concurrency: Optional[int] = None
+    ) -> List[str]:
+        """Generate podcast content for many inputs; synchronous wrapper around agenerate_batch.
+
+        Args:
+            inputs (List[str]): Input texts, one per podcast
+            image_file_paths_list (Optional[List[List[str]]]): Image paths for each input
+            max_concurrency (Optional[int]): Maximum requests in flight
+
+        Returns:
+            List[str]: Cleaned transcripts, in input order
+        """
+        return _run_sync(self.agenerate_batch(inputs, image_file_paths_list, max_concurrency))
+
+    async def agenerate_batch(
+        self,
+        inputs: List[str],
+        image_file_paths_list: Optional[List[List[str]]] = None,
+        max_concurrency: Optional[int] = None
+    ) -> List[str]:
+        """Generate podcast content for many inputs with bounded concurrency.
+
+        Args:
+            inputs (List[str]): Input texts, one per podcast
+            image_file_paths_list (Optional[List[List[str]]]): Image paths for each input
+            max_concurrency (Optional[int]): Maximum requests in flight; defaults to
+                content_generator.max_concurrency from config.yaml
+
+        Returns:
+            List[str]: Cleaned transcripts, in input order
+        """
+        if image_file_paths_list is None:
+            image_file_paths_list = [[] for _ in inputs]
+        if max_concurrency is None:
+            max_concurrency = self.content_generator_config.get("max_concurrency", 8)
+        self.template.validate_params(self.config_conversation)
+
+        # Inputs with the same number of images share a prompt, so batch them together
+        groups: Dict[int, List[int]] = {}
+        for i, image_file_paths in enumerate(image_file_paths_list):
+            num_images = 0 if self.is_local else len(image_file_paths)
+            groups.setdefault(num_images, []).append(i)
+
+        # The limit applies to the whole call, so split it across groups
+        per_group_concurrency = max(1, max_concurrency // len(groups)) if groups else max_concurrency
+
+        async def _run_group(num_images: int, indices: List[int]) -> List[str]:
+            chain, image_path_keys = self._build_chain(num_images)
+            params_list = [
+                self._build_prompt_params(inputs[i], image_path_keys, image_file_paths_list[i])
+                for i in indices
+            ]
+            return await chain.abatch(params_list, config={"max_concurrency": per_group_concurrency})
+
+        logger.info(f"Generating {len(inputs)} podcasts (max concurrency {max_concurrency})")
+        group_responses = await asyncio.gather(
+            *(_run_group(num_images, indices) for num_images, indices in groups.items())
+        )
+
+        responses: List[str] = [""] * len(inputs)
+        for indices, group in zip(groups.values(), group_responses):
+            for i, response in zip(indices, group):
+                responses[i] = self.template.clean_markup(response)
+        # The batch is done; release the transcripts held by the cleaning cache
+        self.template.clear_markup_cache()
+        return responses
@@ -10,7 +10,7 @@ import logging
 import re
 from typing import List, Union
 from urllib.parse import urlparse
-from langsmith import traceable
+from podcastfy.utils.tracing import maybe_traceable
 from .youtube_transcriber import YouTubeTranscriber
 from .website_extractor import WebsiteExtractor
 from .pdf_extractor import PDFExtractor
@@ -49,7 +49,7 @@ class ContentExtractor:
 		except ValueError:
 			return False
 
-	@traceable(name="extract_from_directory")
+	@maybe_traceable(name="extract_from_directory")
 	def extract_from_directory(self, directory: str, recursive: bool = False, file_types: List[str] = None) -> str:
 		"""Extract content from all files in a directory.
 		
@@ -79,7 +79,7 @@ class ContentExtractor:
 				
 		return "\n\n".join(contents)
 
-	@traceable(name="extract_content")
+	@maybe_traceable(name="extract_content")
 	def extract_content(self, source: str) -> str:
 		"""
 		Extract content from various sources.
@@ -113,7 +113,7 @@ class ContentExtractor:
 			logger.error(f"Error extracting content from {source}: {str(e)}")
 			raise
 	
-	@traceable(name="generate_topic_content")
+	@maybe_traceable(name="generate_topic_content")
 	def generate_topic_content(self, topic: str) -> str:
 		"""
 		Generate content based on a given topic using a generative model.
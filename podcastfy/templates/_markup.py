@@ -0,0 +1,109 @@
+"""Pure string helpers for transcript markup cleaning.
+
+These functions do character-level work on every LLM response and use only
+typed str operations, so this module can optionally be compiled with Cython
+(see setup.py). The pure Python version is used when no compiled module is
+present.
+"""
+
+from typing import List, Optional, Sequence
+
+
+def ensure_closed(text: str, tags: Sequence[str]) -> str:
+    """Close every supported tag block right before the next opening tag.
+    
+    Walks the text once, so the cost stays linear on any input. A trailing
+    newline stays outside the last block.
+    
+    Args:
+        text: Text whose tag blocks should be closed
+        tags: Supported tag names
+        
+    Returns:
+        Text with a closing tag appended to each block
+    """
+    tag_pairs = [(f"<{tag}>", f"</{tag}>") for tag in tags]
+    parts: List[str] = []
+    copied = 0  # Start of the text not yet copied into parts
+    closing: Optional[str] = None  # Closing tag owed by the block currently open
+    pos = text.find("<")
+    while pos != -1:
+        for opening, closing_tag in tag_pairs:
+            if text.startswith(opening, pos):
+                if closing:
+                    parts.append(text[copied:pos])
+                    parts.append(closing)
+                    copied = pos
+                closing = closing_tag
+                pos += len(opening) - 1
+                break
+        pos = text.find("<", pos + 1)
+    if closing is None:
+        return text
+    end = len(text) - 1 if text.endswith("\n") else len(text)
+    parts.append(text[copied:end])
+    parts.append(closing)
+    parts.append(text[end:])
+    return "".join(parts)
+
+
+# Closing character for each supported opening character
+_CLOSERS = {"[": "]", "(": ")"}
+
+
+def strip_enclosed(text: str, openers: str = "[", max_span: int = 500) -> str:
+    """Remove bracketed or parenthesized asides such as [laughs] or (pause).
+    
+    All requested opener kinds are handled in one pass over the text. Groups
+    are matched by depth, so nested groups are removed whole. A group is only
+    removed when it closes on the same line within max_span characters;
+    otherwise the opening character is left as-is.
+    
+    Args:
+        text: Text to clean
+        openers: Opening characters to handle, any of "[" and "("
+        max_span: Longest group to remove, in characters
+        
+    Returns:
+        Text with enclosed groups removed
+    """
+    # Next occurrence of each opener, refreshed only once the scan passes it
+    next_pos = {opener: text.find(opener) for opener in openers}
+    parts: List[str] = []
+    copied = 0  # Start of the text not yet copied into parts
+    scan = 0  # Position from which the next group is searched
+    while True:
+        for opener, found in next_pos.items():
+            if found != -1 and found < scan:
+                next_pos[opener] = text.find(opener, scan)
+        candidates = [found for found in next_pos.values() if found != -1]
+        if not candidates:
+            break
+        pos = min(candidates)
+        opener = text[pos]
+        closer = _CLOSERS[opener]
+        limit = min(len(text), pos + max_span)
+        depth = 0
+        end = -1
+        i = pos
+        while i < limit:
+            char = text[i]
+            if char == opener:
+                depth += 1
+            elif char == closer:
+                depth -= 1
+                if depth == 0:
+                    end = i
+                    break
+            elif char == "\n":
+                break
+            i += 1
+        if end == -1:
+            scan = pos + 1
+            continue
+        parts.append(text[copied:pos])
+        copied = scan = end + 1
+    if not parts:
+        return text
+    parts.append(text[copied:])
+    return "".join(parts)
@@ -1,8 +1,49 @@
 """Base template class for podcast generation."""
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 import re
 
+from ._markup import ensure_closed, strip_enclosed
+
+# Tags allowed in every format in addition to the format-specific ones
+COMMON_TAGS = ["speak", "lang", "p", "phoneme", "s", "sub"]
+
+# Patterns that do not depend on the format's tags, compiled once
+_SCRATCHPAD_RE = re.compile(
+    r'```scratchpad\n.*?```\n?|```plaintext\n.*?```\n?|```\n?', re.DOTALL
+)
+_UNDERSCORE_RE = re.compile(r'_(.*?)_')
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+_ASTERISK_RE = re.compile(r"\*")
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=None)
+def _compile_tag_patterns(supported_tags: Tuple[str, ...]) -> Dict[str, Any]:
+    """Compile the cleaning patterns that depend on a format's supported tags.
+    
+    Args:
+        supported_tags: Format-specific tags
+        
+    Returns:
+        Dictionary of compiled patterns, shared by all templates with the same tags
+    """
+    tag_pattern = "|".join(supported_tags)
+    supported = COMMON_TAGS + list(supported_tags)
+    # Speaker blocks are meant to be consecutive, so they are never merged
+    mergeable_pattern = "|".join(tag for tag in supported_tags if tag != "Speaker")
+    # Each pattern covers every tag through alternation, so the text is scanned once
+    return {
+        "xml": re.compile(f"xml(?=\\s*</(?:{tag_pattern})>)"),
+        "unsupported": re.compile(r"</?(?!(?:" + "|".join(supported) + r")\b)[^>]+>"),
+        # The backreference only matches a closing tag followed by the same opening tag
+        "consecutive": re.compile(f'</({mergeable_pattern})>\\s*<\\1>') if mergeable_pattern else None,
+        "space_after": re.compile(f'</({tag_pattern})>(<[^>]+>)'),
+        "space_before": re.compile(f'([^>\\s])(<(?:{tag_pattern})>)'),
+    }
+
+
 class PodcastTemplate:
     """Base class for podcast templates.
     
@@ -40,6 +81,10 @@ class PodcastTemplate:
         if missing:
             raise ValueError(f"Missing required parameters: {', '.join(missing)}")
     
+    def _tag_patterns(self) -> Dict[str, Any]:
+        """Get the compiled cleaning patterns for this template's supported tags."""
+        return _compile_tag_patterns(tuple(self.supported_tags))
+    
     def clean_markup(self, text: str) -> str:
         """Clean markup tags in the text.
         
@@ -60,6 +105,12 @@ class PodcastTemplate:
         
         return text
     
+    def clear_markup_cache(self) -> None:
+        """Drop any memoized clean_markup results.
+        
+        Templates that memoize cleaning override this; the base class keeps no cache.
+        """
+    
     def _clean_scratchpad(self, text: str) -> str:
         """Remove scratchpad blocks and other unwanted markup.
         
@@ -71,19 +122,16 @@ class PodcastTemplate:
         """
         try:
             # Remove scratchpad blocks, plaintext blocks, standalone backticks
-            pattern = r'```scratchpad\n.*?```\n?|```plaintext\n.*?```\n?|```\n?|\[.*?\]'
-            cleaned_text = re.sub(pattern, '', text, flags=re.DOTALL)
+            cleaned_text = _SCRATCHPAD_RE.sub('', text)
+            
+            # Remove bracketed asides such as [laughs]
+            cleaned_text = strip_enclosed(cleaned_text, "[")
             
             # Remove "xml" if followed by a closing tag
-            tag_pattern = "|".join(self.supported_tags)
-            cleaned_text = re.sub(
-                f"xml(?=\s*</(?:{tag_pattern})>)",
-                "",
-                cleaned_text
-            )
+            cleaned_text = self._tag_patterns()["xml"].sub("", cleaned_text)
             
             # Remove underscores around words
-            cleaned_text = re.sub(r'_(.*?)_', r'\1', cleaned_text)
+            cleaned_text = _UNDERSCORE_RE.sub(r'\1', cleaned_text)
             
             return cleaned_text.strip()
             
@@ -102,28 +150,19 @@ class PodcastTemplate:
             Text with only supported tags remaining
         """
         try:
-            # Define supported tags (format-specific tags + common ones)
-            supported = ["speak", "lang", "p", "phoneme", "s", "sub"]
-            supported.extend(self.supported_tags)
+            patterns = self._tag_patterns()
             
-            # Remove any tags that aren't in supported list
-            pattern = r"</?(?!(?:" + "|".join(supported) + r")\b)[^>]+>"
-            cleaned_text = re.sub(pattern, "", text)
+            # Remove any tags that aren't supported (format-specific tags + common ones)
+            cleaned_text = patterns["unsupported"].sub("", text)
             
             # Clean up extra newlines
-            cleaned_text = re.sub(r"\n\s*\n", "\n", cleaned_text)
+            cleaned_text = _BLANK_LINES_RE.sub("\n", cleaned_text)
             
             # Remove asterisks
-            cleaned_text = re.sub(r"\*", "", cleaned_text)
+            cleaned_text = _ASTERISK_RE.sub("", cleaned_text)
             
             # Ensure all supported tags are properly closed
-            for tag in self.supported_tags:
-                cleaned_text = re.sub(
-                    f'<{tag}>(.*?)(?=<(?:{"|".join(self.supported_tags)})>|$)',
-                    f"<{tag}>\\1</{tag}>",
-                    cleaned_text,
-                    flags=re.DOTALL
-                )
+            cleaned_text = ensure_closed(cleaned_text, self.supported_tags)
             
             return cleaned_text.strip()
             
@@ -142,22 +181,24 @@ class PodcastTemplate:
             Text with fixed tags
         """
         try:
+            patterns = self._tag_patterns()
+            
             # Fix consecutive closing/opening tags of the same type, but not for Speaker tags
-            for tag in self.supported_tags:
-                if tag != "Speaker":
-                    # Replace </tag><tag> with a space
-                    pattern = f'</{tag}>\s*<{tag}>'
-                    text = re.sub(pattern, ' ', text)
+            if patterns["consecutive"]:
+                # Replace </tag><tag> with a space, repeating in case a merge
+                # exposes another pair (e.g. </Person2></Person1><Person1><Person2>)
+                merged = 1
+                while merged:
+                    text, merged = patterns["consecutive"].subn(' ', text)
             
             # Clean up any extra whitespace
-            text = re.sub(r'\s+', ' ', text)
+            text = _WHITESPACE_RE.sub(' ', text)
             
             # Ensure proper spacing around tags
-            for tag in self.supported_tags:
-                # Add space after closing tag if followed by another tag
-                text = re.sub(f'</{tag}>(<[^>]+>)', f'</{tag}> \\1', text)
-                # Add space before opening tag if preceded by text
-                text = re.sub(f'([^>\s])(<{tag}>)', '\\1 \\2', text)
+            # Add space after closing tag if followed by another tag
+            text = patterns["space_after"].sub(r'</\1> \2', text)
+            # Add space before opening tag if preceded by text
+            text = patterns["space_before"].sub(r'\1 \2', text)
             
             return text.strip()
             
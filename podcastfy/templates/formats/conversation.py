@@ -1,10 +1,42 @@
 """Conversation format template for podcast generation."""
 
+import logging
+
 from ..base import PodcastTemplate
 
+logger = logging.getLogger(__name__)
+
 class ConversationTemplate(PodcastTemplate):
     """Template for generating conversation-style podcasts."""
     
+    _LONGFORM_INSTRUCTIONS = """
+Format Rules for Long-form Conversation:
+1. Tag Usage:
+   - Use <Person1> and <Person2> tags for all dialogue
+   - Each speaker's line must be in their respective tags
+   - Tags must be properly closed
+   - No untagged speech
+
+2. Speaker Alternation:
+   - Look at the last speaker in CONTEXT
+   - If Person1 spoke last, start with Person2
+   - If Person2 spoke last, start with Person1
+   - Maintain strict alternation between speakers
+   - No consecutive same-speaker lines
+
+3. Speaker Roles:
+   - Person1 guides discussion and asks questions
+   - Person2 provides insights and detailed responses
+   - Keep roles consistent throughout
+   - No switching roles between speakers
+
+4. Flow Rules:
+   - Continue directly from previous context
+   - No meta-commentary about parts or breaks
+   - No greetings or farewells except when instructed
+   - Keep conversation flowing naturally
+   - Each line must build on previous context"""
+    
     def __init__(self):
         """Initialize conversation template."""
         super().__init__("conversation")
@@ -38,33 +70,5 @@ Example format:
 
     def get_longform_instructions(self) -> str:
         """Get format-specific instructions for longform content."""
-        print(f"\n=== Getting Conversation Longform Instructions ===")
-        instructions = """
-Format Rules for Long-form Conversation:
-1. Tag Usage:
-   - Use <Person1> and <Person2> tags for all dialogue
-   - Each speaker's line must be in their respective tags
-   - Tags must be properly closed
-   - No untagged speech
-
-2. Speaker Alternation:
-   - Look at the last speaker in CONTEXT
-   - If Person1 spoke last, start with Person2
-   - If Person2 spoke last, start with Person1
-   - Maintain strict alternation between speakers
-   - No consecutive same-speaker lines
-
-3. Speaker Roles:
-   - Person1 guides discussion and asks questions
-   - Person2 provides insights and detailed responses
-   - Keep roles consistent throughout
-   - No switching roles between speakers
-
-4. Flow Rules:
-   - Continue directly from previous context
-   - No meta-commentary about parts or breaks
-   - No greetings or farewells except when instructed
-   - Keep conversation flowing naturally
-   - Each line must build on previous context"""
-        print(f"Instructions:\n{instructions}")
-        return instructions
+        logger.debug("Getting conversation longform instructions")
+        return self._LONGFORM_INSTRUCTIONS
@@ -1,65 +1,20 @@
 """Monologue format template for podcast generation."""
 
+from functools import lru_cache
+
 from ..base import PodcastTemplate
-import re
+from .._markup import strip_enclosed
+
+# Conversation-style tags converted to Speaker tags
+CONVERSATION_TAGS = ["Person1", "Person2"]
+# Number of cleaned transcripts remembered per template; each entry holds a whole
+# transcript and its cleaned copy, and a retry only repeats the most recent ones
+CLEAN_CACHE_SIZE = 4
 
 class MonologueTemplate(PodcastTemplate):
     """Template for generating monologue-style podcasts."""
     
-    def __init__(self):
-        """Initialize monologue template."""
-        super().__init__("monologue")
-        self.supported_tags = ["Speaker"]
-        self.conversation_tags = ["Person1", "Person2"]  # Tags to convert
-    
-    def clean_markup(self, text: str) -> str:
-        """Clean markup tags in the text.
-        
-        Override base method to handle conversation-style tags first.
-        
-        Args:
-            text: Text to clean
-            
-        Returns:
-            Cleaned text with only supported tags
-        """
-        # First convert any conversation-style tags to monologue format
-        text = self._convert_conversation_tags(text)
-        
-        # Then apply base cleaning
-        return super().clean_markup(text)
-    
-    def _convert_conversation_tags(self, text: str) -> str:
-        """Convert conversation-style tags to monologue format.
-        
-        Args:
-            text: Text to convert
-            
-        Returns:
-            Text with conversation tags converted to monologue format
-        """
-        # Replace opening tags
-        for tag in self.conversation_tags:
-            text = re.sub(
-                f'<{tag}>', 
-                '<Speaker>', 
-                text
-            )
-            text = re.sub(
-                f'</{tag}>', 
-                '</Speaker>', 
-                text
-            )
-        
-        # Clean up any remaining conversation markers
-        text = re.sub(r'\[.*?\]', '', text)  # Remove square brackets
-        text = re.sub(r'\(.*?\)', '', text)  # Remove parentheses
-        
-        return text
-    
-    def get_template(self) -> str:
-        """Get the monologue template string."""
-        return """Format Requirements:
+    _TEMPLATE = """Format Requirements:
 1. Tag Usage:
    - Use <Speaker> tags for all content
    - Each paragraph must be in its own tag
@@ -88,9 +43,7 @@ Additional Notes:
 - Break long explanations into multiple <Speaker> blocks.
 """
 
-    def get_longform_instructions(self) -> str:
-        """Get format-specific instructions for longform content."""
-        instructions = """
+    _LONGFORM_INSTRUCTIONS = """
 Format Rules for Long-form Monologue:
 1. Tag Usage:
    - Use <Speaker> tags for each paragraph
@@ -124,4 +77,72 @@ Additional Notes:
 - Aim for 2-3 sentences per <Speaker> block.
 - Break long explanations into multiple <Speaker> blocks.
 """
-        return instructions
+    
+    def __init__(self):
+        """Initialize monologue template."""
+        super().__init__("monologue")
+        self.supported_tags = ["Speaker"]
+        self.conversation_tags = list(CONVERSATION_TAGS)  # Tags to convert
+        # Retries and previews clean the same transcript again; remember recent results
+        self._clean_cached = lru_cache(maxsize=CLEAN_CACHE_SIZE)(self._clean_markup_uncached)
+    
+    def clean_markup(self, text: str) -> str:
+        """Clean markup tags in the text.
+        
+        Override base method to handle conversation-style tags first.
+        Results are memoized, so cleaning an identical transcript again is a lookup.
+        
+        Args:
+            text: Text to clean
+            
+        Returns:
+            Cleaned text with only supported tags
+        """
+        return self._clean_cached(text)
+    
+    def clear_markup_cache(self) -> None:
+        """Drop memoized clean_markup results."""
+        self._clean_cached.cache_clear()
+    
+    def _clean_markup_uncached(self, text: str) -> str:
+        """Clean markup tags in the text without consulting the cache.
+        
+        Args:
+            text: Text to clean
+            
+        Returns:
+            Cleaned text with only supported tags
+        """
+        # First convert any conversation-style tags to monologue format
+        text = self._convert_conversation_tags(text)
+        
+        # Then apply base cleaning
+        return super().clean_markup(text)
+    
+    def _convert_conversation_tags(self, text: str) -> str:
+        """Convert conversation-style tags to monologue format.
+        
+        Args:
+            text: Text to convert
+            
+        Returns:
+            Text with conversation tags converted to monologue format
+        """
+        # Replace opening and closing tags; they are literals, so no regex is needed.
+        # Each tag name is a substring of both forms, so a miss rules out both.
+        for tag in CONVERSATION_TAGS:
+            if tag in text:
+                text = text.replace(f'<{tag}>', '<Speaker>').replace(f'</{tag}>', '</Speaker>')
+        
+        # Clean up any remaining conversation markers
+        text = strip_enclosed(text, "[(")  # Remove square brackets and parentheses
+        
+        return text
+    
+    def get_template(self) -> str:
+        """Get the monologue template string."""
+        return self._TEMPLATE
+
+    def get_longform_instructions(self) -> str:
+        """Get format-specific instructions for longform content."""
+        return self._LONGFORM_INSTRUCTIONS
@@ -11,10 +11,13 @@ import logging
 import os
 import re
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Dict, Any
-from pydub import AudioSegment
 
 from .tts.factory import TTSProviderFactory
+from .utils.audio import MP3_EXPORT_PARAMETERS, can_concat_mp3, concat_mp3, join_segments
+from .utils.cache import AudioCache
 from .utils.config import load_config
 from .utils.config_conversation import load_conversation_config
 
@@ -51,16 +54,29 @@ class TextToSpeech:
             provider_name=model, api_key=api_key, model=model
         )
 
+        # Optional persistent cache of synthesized audio, used by providers that support it
+        cache_config = self.tts_config.get("audio_cache", {})
+        if cache_config.get("enabled", False):
+            self.provider.audio_cache = AudioCache(
+                cache_config.get("path", "data/cache/tts"),
+                max_size_bytes=int(cache_config.get("max_size_mb", 1024)) * 1024 * 1024
+            )
+
         # Setup directories and config
         self._setup_directories()
         self.audio_format = self.tts_config.get("audio_format", "mp3")
         self.ending_message = self.tts_config.get("ending_message", "")
 
+        # Resolve provider settings once; they do not change between conversions
+        self._provider_config = self._get_provider_config()
+        voices = self._provider_config["default_voices"]
+        self._voice_q = voices.get("question")
+        self._voice_a = voices.get("answer")
+        self._model = self._provider_config["model"]
+        self._is_multi = "multi" in (self.provider.model or "").lower()
+
     def _get_provider_config(self) -> Dict[str, Any]:
         """Get provider-specific configuration."""
-        # Get provider name in lowercase without 'TTS' suffix
-        provider_name = self.provider.__class__.__name__.lower().replace("tts", "")
-        
         # Get default voices from the config passed in
         voices = self.tts_config.get("default_voices", {})
         
@@ -89,13 +105,10 @@ class TextToSpeech:
         cleaned_text = text
 
         try:
-            if (
-                "multi" in self.provider.model.lower()
-            ):  # refactor: We should have instead MultiSpeakerTTS and SingleSpeakerTTS classes
-                provider_config = self._get_provider_config()
-                voice = provider_config.get("default_voices", {}).get("question")
-                voice2 = provider_config.get("default_voices", {}).get("answer")
-                model = provider_config.get("model")
+            voice, voice2, model = self._voice_q, self._voice_a, self._model
+            if self._is_multi:  # refactor: We should have instead MultiSpeakerTTS and SingleSpeakerTTS classes
+                # Synthesis is network-bound; assembly is the only local work, so time them apart
+                started = time.perf_counter()
                 audio_data_list = self.provider.generate_audio(
                     cleaned_text,
                     voice=voice,
@@ -103,6 +116,8 @@ class TextToSpeech:
                     voice2=voice2 if self.format_type == "conversation" else None,
                     ending_message=self.ending_message,
                 )
+                logger.info(f"TTS synthesis took {time.perf_counter() - started:.2f}s")
+                started = time.perf_counter()
 
                 try:
                     # First verify we have data
@@ -110,48 +125,70 @@ class TextToSpeech:
                         raise ValueError("No audio data chunks provided")
 
                     print(f"\nStarting TTS processing with {len(audio_data_list)} chunks...")
-                    combined = AudioSegment.empty()
+                    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                    
+                    if self.audio_format == "mp3" and can_concat_mp3(audio_data_list):
+                        # Chunks are MP3 in one stream format, so the frames can be joined without a decode/re-encode pass
+                        audio_data = concat_mp3(audio_data_list)
+                        print("\nExporting final audio:")
+                        print(f"  - Size: {len(audio_data)/1024:.1f}KB")
+                        print(f"  - Format: {self.audio_format}")
+                        print(f"  - Output: {output_file}")
+                        with open(output_file, "wb") as f:
+                            f.write(audio_data)
+                        print("\nAudio export complete!")
+                        logger.info(f"Audio assembly (byte join) took {time.perf_counter() - started:.2f}s")
+                        return
+                    
+                    # Mixed or non-MP3 output needs a decode/re-encode pass through pydub
+                    from pydub import AudioSegment
+                    
+                    # Each decode runs in an ffmpeg subprocess, so threads decode chunks in parallel
+                    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                        decoded = list(executor.map(
+                            lambda chunk: AudioSegment.from_file(io.BytesIO(chunk)), audio_data_list
+                        ))
+                    
+                    segments = []
                     total_duration = 0
                     
-                    for i, chunk in enumerate(audio_data_list):
+                    for i, (chunk, segment) in enumerate(zip(audio_data_list, decoded)):
                         print(f"\nProcessing TTS chunk {i+1}/{len(audio_data_list)}")
                         print(f"  - Size: {len(chunk)/1024:.1f}KB")
                         
-                        segment = AudioSegment.from_file(io.BytesIO(chunk))
                         duration_sec = len(segment)/1000
                         total_duration += duration_sec
                         
                         print(f"  - Duration: {duration_sec:.1f}s")
                         print(f"  - Running total: {total_duration:.1f}s")
                         
-                        combined += segment
+                        segments.append(segment)
+                    
+                    combined = join_segments(segments)
                     
                     print("\nExporting final audio:")
                     print(f"  - Total duration: {total_duration:.1f}s")
                     print(f"  - Format: {self.audio_format}")
-                    print(f"  - Bitrate: 320k")
+                    is_mp3 = self.audio_format == "mp3"
+                    if is_mp3:
+                        print(f"  - Encoder options: {' '.join(MP3_EXPORT_PARAMETERS)}")
                     print(f"  - Output: {output_file}")
                     
-                    # Export with high quality settings
-                    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                    # Export MP3 with VBR settings sized for speech; other formats use ffmpeg's default codec
                     combined.export(
                         output_file, 
                         format=self.audio_format,
-                        codec="libmp3lame",
-                        bitrate="320k"
+                        codec="libmp3lame" if is_mp3 else None,
+                        parameters=MP3_EXPORT_PARAMETERS if is_mp3 else None
                     )
                     print("\nAudio export complete!")
+                    logger.info(f"Audio assembly (re-encode) took {time.perf_counter() - started:.2f}s")
                     
                 except Exception as e:
                     logger.error(f"Error during audio processing: {str(e)}")
                     raise
             else:
                 # For single speaker providers
-                provider_config = self._get_provider_config()
-                voice = provider_config.get("default_voices", {}).get("question")
-                voice2 = provider_config.get("default_voices", {}).get("answer")
-                model = provider_config.get("model")
-                
                 print(f"\nGenerating audio with {self.provider.__class__.__name__}:")
                 print(f"  - Model: {model}")
                 print(f"  - Voice: {voice}")
@@ -159,29 +196,35 @@ class TextToSpeech:
                     print(f"  - Secondary voice: {voice2}")
                 
                 # Generate audio with voice2 for conversation format
+                started = time.perf_counter()
                 audio_data = self.provider.generate_audio(
                     cleaned_text,
                     voice=voice,
                     model=model,
                     voice2=voice2 if self.format_type == "conversation" else None
                 )
+                logger.info(f"TTS synthesis took {time.perf_counter() - started:.2f}s")
                 
                 print(f"\nProcessing audio:")
                 print(f"  - Size: {len(audio_data)/1024:.1f}KB")
                 
-                # Load into AudioSegment to get duration
-                segment = AudioSegment.from_file(io.BytesIO(audio_data))
-                duration_sec = len(segment)/1000
-                print(f"  - Duration: {duration_sec:.1f}s")
-                
                 print(f"\nExporting audio:")
                 print(f"  - Format: {self.audio_format}")
                 print(f"  - Output: {output_file}")
                 
-                # Save audio data directly
                 os.makedirs(os.path.dirname(output_file), exist_ok=True)
-                with open(output_file, "wb") as f:
-                    f.write(audio_data)
+                if self.audio_format == "mp3":
+                    # Providers return MP3, so the bytes are saved as-is without a decode
+                    with open(output_file, "wb") as f:
+                        f.write(audio_data)
+                else:
+                    # Any other output format needs one transcode through pydub
+                    from pydub import AudioSegment
+                    started = time.perf_counter()
+                    AudioSegment.from_file(io.BytesIO(audio_data)).export(
+                        output_file, format=self.audio_format
+                    )
+                    logger.info(f"Audio transcode to {self.audio_format} took {time.perf_counter() - started:.2f}s")
                 
                 print("\nAudio export complete!")
                 logger.info(f"Audio saved to {output_file}")
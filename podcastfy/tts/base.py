@@ -1,9 +1,32 @@
 """Abstract base class for Text-to-Speech providers."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, ClassVar, Tuple
 import re
 
+# Adjacent Person1/Person2 turns
+_QA_PAIR_RE = re.compile(r"<Person1>(.*?)</Person1>\s*<Person2>(.*?)</Person2>", re.DOTALL)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+
+@lru_cache(maxsize=32)
+def _compile_markup_patterns(supported_tags: Tuple[str, ...],
+                             additional_tags: Tuple[str, ...]) -> Tuple[re.Pattern, Tuple[Tuple[str, re.Pattern], ...]]:
+    """Compile the clean_tss_markup patterns for one combination of tags.
+
+    Returns:
+        The unsupported-tag pattern, and a (tag, pattern) pair per additional tag
+        for restoring its closing tag
+    """
+    unsupported = re.compile(r'</?(?!(?:' + '|'.join(supported_tags) + r')\b)[^>]+>')
+    closers = tuple(
+        (tag, re.compile(f'<{tag}>(.*?)(?=<(?:{"|".join(additional_tags)})>|$)', re.DOTALL))
+        for tag in additional_tags
+    )
+    return unsupported, closers
+
+
 class TTSProvider(ABC):
     """Abstract base class that defines the interface for TTS providers."""
     
@@ -12,6 +35,9 @@ class TTSProvider(ABC):
         'lang', 'p', 'phoneme', 's', 'sub'
     ]
     
+    # Optional AudioCache consulted by providers that support caching synthesized audio
+    audio_cache = None
+    
     @abstractmethod
     def generate_audio(self, text: str, voice: str, model: str, voice2: str) -> bytes:
         """
@@ -54,6 +80,57 @@ class TTSProvider(ABC):
         if not model:
             raise ValueError("Model must be specified")
         
+    @staticmethod
+    def extract_tagged(text: str, tag: str, start: int = 0) -> List[str]:
+        """
+        Extract the contents of every <tag>...</tag> block in the text.
+
+        Scans the literal delimiters with str.find, matching the results of
+        re.findall(r'<tag>(.*?)</tag>', text, re.DOTALL) in linear time.
+
+        Args:
+            text (str): Input text containing the tags.
+            tag (str): Tag name without angle brackets.
+            start (int): Offset to start scanning from, e.g. a known first match.
+
+        Returns:
+            List[str]: Contents of each block, in order of appearance.
+        """
+        open_tag, close_tag = f"<{tag}>", f"</{tag}>"
+        contents = []
+        pos = start
+        while True:
+            start = text.find(open_tag, pos)
+            if start < 0:
+                break
+            start += len(open_tag)
+            end = text.find(close_tag, start)
+            if end < 0:
+                break
+            contents.append(text[start:end])
+            pos = end + len(close_tag)
+        return contents
+
+    @staticmethod
+    def merge_consecutive_turns(turns: List[Tuple[str, str]], max_chars: int) -> List[Tuple[str, str]]:
+        """
+        Merge consecutive turns spoken with the same voice into single requests.
+
+        Args:
+            turns (List[Tuple[str, str]]): (voice, text) pairs in playback order, with stripped text.
+            max_chars (int): Maximum length of a merged text; longer merges are not made.
+
+        Returns:
+            List[Tuple[str, str]]: (voice, text) pairs with runs of the same voice joined by spaces.
+        """
+        merged: List[Tuple[str, str]] = []
+        for voice, text in turns:
+            if merged and merged[-1][0] == voice and len(merged[-1][1]) + 1 + len(text) <= max_chars:
+                merged[-1] = (voice, f"{merged[-1][1]} {text}")
+            else:
+                merged.append((voice, text))
+        return merged
+
     def split_qa(self, input_text: str, ending_message: str, supported_tags: List[str] = None) -> List[Tuple[str, str]]:
         """
         Split the input text into question-answer pairs.
@@ -75,11 +152,8 @@ class TTSProvider(ABC):
         if input_text.strip().endswith("</Person1>"):
             input_text += f"<Person2>{ending_message}</Person2>"
 
-        # Regular expression pattern to match Person1 and Person2 dialogues
-        pattern = r"<Person1>(.*?)</Person1>\s*<Person2>(.*?)</Person2>"
-
-        # Find all matches in the input text
-        matches = re.findall(pattern, input_text, re.DOTALL)
+        # Find all Person1 and Person2 dialogue pairs in the input text
+        matches = _QA_PAIR_RE.findall(input_text)
 
         # Process the matches to remove extra whitespace and newlines
         processed_matches = [
@@ -100,25 +174,24 @@ class TTSProvider(ABC):
             str: Cleaned text with unsupported TSS markup tags removed.
         """
         if supported_tags is None:
-            supported_tags = self.COMMON_SSML_TAGS.copy()
+            supported_tags = self.COMMON_SSML_TAGS
 
-        # Append additional tags to the supported tags list
-        supported_tags.extend(additional_tags)
+        # Append additional tags to the supported tags list, without mutating the caller's list
+        supported_tags = list(supported_tags) + list(additional_tags)
 
-        # Create a pattern that matches any tag not in the supported list
-        pattern = r'</?(?!(?:' + '|'.join(supported_tags) + r')\b)[^>]+>'
+        # Patterns that match any tag not in the supported list, and each additional tag's block
+        unsupported_pattern, closer_patterns = _compile_markup_patterns(
+            tuple(supported_tags), tuple(additional_tags)
+        )
 
         # Remove unsupported tags
-        cleaned_text = re.sub(pattern, '', input_text)
+        cleaned_text = unsupported_pattern.sub('', input_text)
 
         # Remove any leftover empty lines
-        cleaned_text = re.sub(r'\n\s*\n', '\n', cleaned_text)
+        cleaned_text = _BLANK_LINES_RE.sub('\n', cleaned_text)
 
         # Ensure closing tags for additional tags are preserved
-        for tag in additional_tags:
-            cleaned_text = re.sub(f'<{tag}>(.*?)(?=<(?:{"|".join(additional_tags)})>|$)', 
-                                f'<{tag}>\\1</{tag}>', 
-                                cleaned_text, 
-                                flags=re.DOTALL)
+        for tag, pattern in closer_patterns:
+            cleaned_text = pattern.sub(f'<{tag}>\\1</{tag}>', cleaned_text)
 
         return cleaned_text.strip()
\ No newline at end of file
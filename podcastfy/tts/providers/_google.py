@@ -0,0 +1,147 @@
+"""Shared request dispatch for the Google Cloud Text-to-Speech providers."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from ...utils.cache import AudioCache
+
+logger = logging.getLogger(__name__)
+
+# Maximum synthesize_speech requests in flight per generate_audio call
+MAX_SYNTHESIS_WORKERS = 8
+
+
+@lru_cache(maxsize=None)
+def shared_client(client_class: Callable[[], Any]) -> Any:
+    """
+    Get a process-wide instance of a sync Text-to-Speech client class.
+
+    Each client opens its own gRPC channel, and clients are thread-safe, so
+    provider instances share one per API version and reuse its connection.
+    A failed construction is not cached and is retried on the next call.
+
+    Args:
+        client_class: Client class, e.g. texttospeech_v1.TextToSpeechClient
+
+    Returns:
+        The shared client instance
+    """
+    return client_class()
+
+
+def utf8_len(text: str) -> int:
+    """
+    Get the UTF-8 size of a string, which is what the API byte limits count.
+
+    str.isascii() is a constant-time flag check, so ASCII text (most English
+    transcripts) is sized without encoding a copy.
+
+    Args:
+        text (str): Text to measure
+
+    Returns:
+        int: Size of the text in UTF-8 bytes
+    """
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+async def _synthesize_async(async_client_factory: Callable[[], Any],
+                            requests: List[Dict[str, Any]],
+                            max_concurrency: int) -> List[bytes]:
+    """
+    Run synthesize_speech requests on an async client with bounded concurrency.
+
+    Args:
+        async_client_factory: Callable returning a TextToSpeechAsyncClient
+        requests: Keyword arguments for each synthesize_speech call
+        max_concurrency: Maximum requests in flight
+
+    Returns:
+        List[bytes]: Audio content for each request, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # gRPC async channels are bound to the running loop, so the client is created and closed here
+    async with async_client_factory() as client:
+        async def synthesize(request: Dict[str, Any]) -> bytes:
+            async with semaphore:
+                response = await client.synthesize_speech(**request)
+            return response.audio_content
+
+        return list(await asyncio.gather(*(synthesize(request) for request in requests)))
+
+
+def _request_key(request: Dict[str, Any]) -> str:
+    """Build an audio cache key from the serialized fields of a synthesize_speech request."""
+    return AudioCache.make_key(*(
+        type(request[field]).serialize(request[field])
+        for field in ("input", "voice", "audio_config")
+    ))
+
+
+def synthesize_all(client: Any, async_client_factory: Callable[[], Any],
+                   requests: List[Dict[str, Any]],
+                   max_concurrency: int = MAX_SYNTHESIS_WORKERS,
+                   cache: Optional[AudioCache] = None) -> List[bytes]:
+    """
+    Run independent synthesize_speech requests concurrently, preserving their order.
+
+    Requests go through the async client on a private event loop, so many
+    requests share one thread. When called from inside a running event loop,
+    where a nested loop cannot be started, a thread pool over the sync client
+    is used instead. Identical requests (e.g. a repeated transition line) are
+    sent once and their audio is reused.
+
+    Args:
+        client: Sync TextToSpeechClient
+        async_client_factory: Callable returning a TextToSpeechAsyncClient
+        requests: Keyword arguments for each synthesize_speech call
+        max_concurrency: Maximum requests in flight
+        cache: Optional audio cache; only requests missing from it are sent
+
+    Returns:
+        List[bytes]: Audio content for each request, in input order
+    """
+    keys = [_request_key(request) for request in requests]
+    audio: Dict[str, bytes] = {}
+    if cache is not None:
+        for key in dict.fromkeys(keys):
+            data = cache.get(key)
+            if data is not None:
+                audio[key] = data
+
+    # One request per distinct key that is not already cached; the first occurrence is sent
+    pending: Dict[str, Dict[str, Any]] = {}
+    for key, request in zip(keys, requests):
+        if key not in audio and key not in pending:
+            pending[key] = request
+    logger.info(
+        f"Synthesizing {len(pending)} of {len(requests)} requests "
+        f"({len(audio) + len(pending)} distinct, {len(audio)} cached)"
+    )
+
+    fresh = _dispatch(client, async_client_factory, list(pending.values()), max_concurrency)
+    for key, data in zip(pending, fresh):
+        if cache is not None:
+            cache.set(key, data)
+        audio[key] = data
+    return [audio[key] for key in keys]
+
+
+def _dispatch(client: Any, async_client_factory: Callable[[], Any],
+              requests: List[Dict[str, Any]], max_concurrency: int) -> List[bytes]:
+    """Send synthesize_speech requests concurrently; see synthesize_all."""
+    if not requests:
+        return []
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_synthesize_async(async_client_factory, requests, max_concurrency))
+
+    logger.debug("Event loop already running; synthesizing on a thread pool")
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(requests))) as executor:
+        return list(executor.map(
+            lambda request: client.synthesize_speech(**request).audio_content, requests
+        ))
@@ -1,13 +1,25 @@
 """Google Cloud Text-to-Speech provider implementation for single speaker."""
 
 from google.cloud import texttospeech_v1beta1
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from ..base import TTSProvider
+from ...utils.audio import MP3_EXPORT_PARAMETERS, can_concat_mp3, concat_mp3, join_segments
+from ._google import shared_client, synthesize_all, utf8_len
+from io import BytesIO
 import logging
 import re
+import time
 
 logger = logging.getLogger(__name__)
 
+# Speaker blocks in conversation-format transcripts
+_PERSON1_RE = re.compile(r'<Person1>(.*?)</Person1>', re.DOTALL)
+_PERSON2_RE = re.compile(r'<Person2>(.*?)</Person2>', re.DOTALL)
+# Byte budget for packing Speaker blocks into one request (the API limit is 5000)
+MAX_REQUEST_BYTES = 4500
+# Seconds a fetched voice list is reused; the catalog changes rarely
+VOICES_CACHE_TTL = 3600
+
 class GeminiTTS(TTSProvider):
     """Google Cloud Text-to-Speech provider for single speaker."""
     
@@ -20,15 +32,21 @@ class GeminiTTS(TTSProvider):
             model (str): Default voice model to use
         """
         self.model = model
+        # (fetched_at, voice names) from the last successful list_voices call
+        self._voices_cache: Optional[Tuple[float, List[str]]] = None
         try:
-            # Use Application Default Credentials
-            self.client = texttospeech_v1beta1.TextToSpeechClient()
+            # Use Application Default Credentials; the client and its channel are shared process-wide
+            self.client = shared_client(texttospeech_v1beta1.TextToSpeechClient)
         except Exception as e:
             logger.error(f"Failed to initialize Google TTS client: {str(e)}")
             raise
 
     def get_available_voices(self):
-        """Get available Journey voices from Google Cloud TTS."""
+        """Get available Journey voices from Google Cloud TTS, reusing results for VOICES_CACHE_TTL seconds."""
+        if self._voices_cache is not None:
+            fetched_at, journey_voices = self._voices_cache
+            if time.monotonic() - fetched_at < VOICES_CACHE_TTL:
+                return list(journey_voices)
         try:
             response = self.client.list_voices()
             # Filter for Journey voices
@@ -36,11 +54,120 @@ class GeminiTTS(TTSProvider):
                 voice.name for voice in response.voices 
                 if "Journey" in voice.name
             ]
-            return journey_voices
+            # Failures are not cached, so the next call retries
+            self._voices_cache = (time.monotonic(), journey_voices)
+            return list(journey_voices)
         except Exception as e:
             logger.error(f"Failed to fetch voices: {str(e)}")
             return []
 
+    @staticmethod
+    def _pack_blocks(blocks: List[str], max_bytes: int = MAX_REQUEST_BYTES) -> List[str]:
+        """
+        Greedily pack consecutive text blocks into as few requests as fit the byte budget.
+        
+        Blocks are joined as paragraphs, so a single voice reads them with a
+        natural pause between each. A block larger than the budget is sent alone.
+        
+        Args:
+            blocks (List[str]): Text blocks in reading order
+            max_bytes (int): Maximum UTF-8 size of a packed request
+            
+        Returns:
+            List[str]: Packed request texts, in reading order
+        """
+        packed = []
+        current = []
+        current_bytes = 0
+        for block in blocks:
+            block = block.strip()
+            if not block:
+                continue
+            size = utf8_len(block)
+            # Two bytes for the paragraph separator when joining onto a non-empty group
+            if current and current_bytes + 2 + size > max_bytes:
+                packed.append("\n\n".join(current))
+                current, current_bytes = [], 0
+            current_bytes += size + (2 if current else 0)
+            current.append(block)
+        if current:
+            packed.append("\n\n".join(current))
+        return packed
+
+    def _synthesize_segments(self, segments: List[Tuple[str, str]], label: str) -> List[bytes]:
+        """
+        Synthesize text segments concurrently, preserving their order.
+        
+        Args:
+            segments (List[Tuple[str, str]]): (voice, content) pairs to synthesize
+            label (str): Speaker label used in log messages
+            
+        Returns:
+            List[bytes]: MP3 audio for each segment, in input order
+        """
+        logger.info(f"\nGenerating {label} audio segments ({len(segments)} segments):")
+        if not segments:
+            return []
+        
+        # Requests only differ in text and voice, so build the shared parts once
+        audio_config = texttospeech_v1beta1.AudioConfig(
+            audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3
+        )
+        voice_params = {
+            voice: texttospeech_v1beta1.VoiceSelectionParams(
+                language_code="-".join(voice.split("-")[:2]),
+                name=voice,
+            )
+            for voice in {voice for voice, _ in segments}
+        }
+        
+        requests = [
+            dict(
+                input=texttospeech_v1beta1.SynthesisInput(text=content.strip()),
+                voice=voice_params[voice],
+                audio_config=audio_config
+            )
+            for voice, content in segments
+        ]
+        
+        # Requests are network-bound, so they are all in flight together
+        audio = synthesize_all(
+            self.client, texttospeech_v1beta1.TextToSpeechAsyncClient, requests, cache=self.audio_cache
+        )
+        logger.info(f"Received {label} audio: {sum(len(a) for a in audio)/1024:.1f}KB total")
+        return audio
+
+    @staticmethod
+    def _join_audio(chunks: List[bytes]) -> bytes:
+        """
+        Join MP3 chunks in order, re-encoding only when they cannot be joined as bytes.
+        
+        The two voices of a conversation may come back with different stream formats
+        (e.g. sample rates), and byte-joining those would produce a corrupt stream.
+        
+        Args:
+            chunks (List[bytes]): MP3 audio in playback order
+            
+        Returns:
+            bytes: Combined MP3 audio
+        """
+        if not any(chunks):
+            return b""
+        if can_concat_mp3(chunks):
+            # Join the MP3 frames directly; no decode or re-encode is needed
+            return concat_mp3(chunks)
+        
+        # pydub is only needed on this fallback path, so it is not imported with the module
+        from pydub import AudioSegment
+        
+        logger.info("Audio chunks differ in stream format; re-encoding")
+        combined = join_segments([
+            AudioSegment.from_file(BytesIO(chunk), format="mp3") for chunk in chunks if chunk
+        ])
+        output = BytesIO()
+        combined.export(output, format="mp3", codec="libmp3lame", parameters=MP3_EXPORT_PARAMETERS)
+        return output.getvalue()
+
     def generate_audio(self, text: str, voice: str = None, 
                       model: str = None, voice2: str = None, **kwargs) -> bytes:
         """
@@ -65,106 +192,24 @@ class GeminiTTS(TTSProvider):
             # For conversation format, use different voices for Person1 and Person2
             if "<Person1>" in text and voice2:
                 # Extract Person1 and Person2 content
-                person1_pattern = r'<Person1>(.*?)</Person1>'
-                person2_pattern = r'<Person2>(.*?)</Person2>'
-                
-                person1_matches = re.findall(person1_pattern, text, re.DOTALL)
-                person2_matches = re.findall(person2_pattern, text, re.DOTALL)
+                person1_matches = _PERSON1_RE.findall(text)
+                person2_matches = _PERSON2_RE.findall(text)
                 
-                # Generate audio for Person1 content
-                person1_audio = []
-                logger.info(f"\nGenerating Person1 audio segments ({len(person1_matches)} segments):")
-                for i, content in enumerate(person1_matches, 1):
-                    logger.info(f"\nPerson1 Segment {i}/{len(person1_matches)}:")
-                    logger.info(f"Content length: {len(content)} chars")
-                    logger.info(f"Content preview: {content[:100]}...")
-                    
-                    synthesis_input = texttospeech_v1beta1.SynthesisInput(text=content.strip())
-                    voice_params = texttospeech_v1beta1.VoiceSelectionParams(
-                        language_code="-".join(voice.split("-")[:2]),
-                        name=voice,
-                    )
-                    audio_config = texttospeech_v1beta1.AudioConfig(
-                        audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3
-                    )
-                    
-                    logger.info(f"Sending TTS request for Person1 segment {i}...")
-                    response = self.client.synthesize_speech(
-                        input=synthesis_input,
-                        voice=voice_params,
-                        audio_config=audio_config
-                    )
-                    logger.info(f"Received audio response: {len(response.audio_content)/1024:.1f}KB")
-                    person1_audio.append(response.audio_content)
+                # Build the playback order up front: alternating Person1/Person2 pairs,
+                # plus the last Person1 turn when Person1 has more. Only these turns
+                # are synthesized, and their audio is already in order for joining.
+                ordered_segments = []
+                for p1, p2 in zip(person1_matches, person2_matches):
+                    ordered_segments.append((voice, p1))
+                    ordered_segments.append((voice2, p2))
+                if len(person1_matches) > len(person2_matches):
+                    ordered_segments.append((voice, person1_matches[-1]))
+                # Blank turns would only cost a request, so they are dropped after pairing
+                ordered_segments = [(v, content) for v, content in ordered_segments if content.strip()]
                 
-                # Generate audio for Person2 content
-                person2_audio = []
-                logger.info(f"\nGenerating Person2 audio segments ({len(person2_matches)} segments):")
-                for i, content in enumerate(person2_matches, 1):
-                    logger.info(f"\nPerson2 Segment {i}/{len(person2_matches)}:")
-                    logger.info(f"Content length: {len(content)} chars")
-                    logger.info(f"Content preview: {content[:100]}...")
-                    
-                    synthesis_input = texttospeech_v1beta1.SynthesisInput(text=content.strip())
-                    voice_params = texttospeech_v1beta1.VoiceSelectionParams(
-                        language_code="-".join(voice2.split("-")[:2]),
-                        name=voice2,
-                    )
-                    audio_config = texttospeech_v1beta1.AudioConfig(
-                        audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3
-                    )
-                    
-                    logger.info(f"Sending TTS request for Person2 segment {i}...")
-                    response = self.client.synthesize_speech(
-                        input=synthesis_input,
-                        voice=voice_params,
-                        audio_config=audio_config
-                    )
-                    logger.info(f"Received audio response: {len(response.audio_content)/1024:.1f}KB")
-                    person2_audio.append(response.audio_content)
-                
-                # Merge audio segments alternating between Person1 and Person2
-                from pydub import AudioSegment
-                import io
-                
-                logger.info("\nMerging audio segments:")
-                combined = AudioSegment.empty()
-                total_duration = 0
-                
-                for i, (p1, p2) in enumerate(zip(person1_audio, person2_audio), 1):
-                    logger.info(f"\nProcessing pair {i}/{min(len(person1_audio), len(person2_audio))}:")
-                    
-                    # Add Person1 audio
-                    segment = AudioSegment.from_file(io.BytesIO(p1))
-                    duration = len(segment)/1000
-                    total_duration += duration
-                    logger.info(f"Person1 duration: {duration:.1f}s")
-                    combined += segment
-                    
-                    # Add Person2 audio
-                    segment = AudioSegment.from_file(io.BytesIO(p2))
-                    duration = len(segment)/1000
-                    total_duration += duration
-                    logger.info(f"Person2 duration: {duration:.1f}s")
-                    combined += segment
-                
-                # Handle any remaining Person1 audio
-                if len(person1_audio) > len(person2_audio):
-                    logger.info("\nProcessing final Person1 segment:")
-                    segment = AudioSegment.from_file(io.BytesIO(person1_audio[-1]))
-                    duration = len(segment)/1000
-                    total_duration += duration
-                    logger.info(f"Duration: {duration:.1f}s")
-                    combined += segment
-                
-                logger.info(f"\nTotal duration: {total_duration:.1f}s")
-                
-                # Export combined audio
-                logger.info("\nExporting combined audio...")
-                output = io.BytesIO()
-                combined.export(output, format="mp3", codec="libmp3lame", bitrate="320k")
-                final_audio = output.getvalue()
-                logger.info(f"Final audio size: {len(final_audio)/1024:.1f}KB")
+                ordered_audio = self._synthesize_segments(ordered_segments, "conversation")
+                final_audio = self._join_audio(ordered_audio)
+                logger.info(f"\nFinal audio size: {len(final_audio)/1024:.1f}KB")
                 return final_audio
                 
             else:
@@ -172,61 +217,17 @@ class GeminiTTS(TTSProvider):
                 logger.info("\nProcessing monologue format:")
                 
                 # Extract Speaker content
-                speaker_pattern = r'<Speaker>(.*?)</Speaker>'
-                speaker_matches = re.findall(speaker_pattern, text, re.DOTALL)
-                
-                # Generate audio for Speaker content
-                speaker_audio = []
-                logger.info(f"\nGenerating Speaker audio segments ({len(speaker_matches)} segments):")
-                for i, content in enumerate(speaker_matches, 1):
-                    logger.info(f"\nSpeaker Segment {i}/{len(speaker_matches)}:")
-                    logger.info(f"Content length: {len(content)} chars")
-                    logger.info(f"Content preview: {content[:100]}...")
-                    
-                    synthesis_input = texttospeech_v1beta1.SynthesisInput(text=content.strip())
-                    voice_params = texttospeech_v1beta1.VoiceSelectionParams(
-                        language_code="-".join(voice.split("-")[:2]),
-                        name=voice,
-                    )
-                    audio_config = texttospeech_v1beta1.AudioConfig(
-                        audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3
-                    )
-                    
-                    logger.info(f"Sending TTS request for Speaker segment {i}...")
-                    response = self.client.synthesize_speech(
-                        input=synthesis_input,
-                        voice=voice_params,
-                        audio_config=audio_config
-                    )
-                    logger.info(f"Received audio response: {len(response.audio_content)/1024:.1f}KB")
-                    speaker_audio.append(response.audio_content)
-                
-                # Merge audio segments
-                from pydub import AudioSegment
-                import io
-                
-                logger.info("\nMerging audio segments:")
-                combined = AudioSegment.empty()
-                total_duration = 0
-                
-                for i, p1 in enumerate(speaker_audio, 1):
-                    logger.info(f"\nProcessing segment {i}/{len(speaker_audio)}:")
-                    
-                    # Add Speaker audio
-                    segment = AudioSegment.from_file(io.BytesIO(p1))
-                    duration = len(segment)/1000
-                    total_duration += duration
-                    logger.info(f"Duration: {duration:.1f}s")
-                    combined += segment
+                speaker_matches = self.extract_tagged(text, "Speaker")
                 
-                logger.info(f"\nTotal duration: {total_duration:.1f}s")
+                # Generate audio for Speaker content, packing consecutive blocks into fewer requests
+                request_texts = self._pack_blocks(speaker_matches)
+                logger.info(f"Packed {len(speaker_matches)} Speaker blocks into {len(request_texts)} requests")
+                speaker_audio = self._synthesize_segments(
+                    [(voice, content) for content in request_texts], "Speaker"
+                )
                 
-                # Export combined audio
-                logger.info("\nExporting combined audio...")
-                output = io.BytesIO()
-                combined.export(output, format="mp3", codec="libmp3lame", bitrate="320k")
-                final_audio = output.getvalue()
-                logger.info(f"Final audio size: {len(final_audio)/1024:.1f}KB")
+                final_audio = self._join_audio(speaker_audio)
+                logger.info(f"\nFinal audio size: {len(final_audio)/1024:.1f}KB")
                 return final_audio
             
         except Exception as e:
@@ -276,13 +277,14 @@ class GeminiTTS(TTSProvider):
         """
         input_text = self.clean_tss_markup(input_text, supported_tags=supported_tags)
         
-        # Check if this is monologue format (Speaker tags)
-        if "<Speaker>" in input_text:
+        # Check if this is monologue format (Speaker tags); the scan resumes from the first tag
+        first_tag = input_text.find("<Speaker>")
+        if first_tag >= 0:
             # Split into Speaker sections
-            pattern = r"<Speaker>(.*?)</Speaker>"
-            matches = re.findall(pattern, input_text, re.DOTALL)
-            # For monologue, each Speaker section becomes a "question" with empty "answer"
-            return [(text.strip(), "") for text in matches]
+            matches = self.extract_tagged(input_text, "Speaker", first_tag)
+            # For monologue, each non-blank Speaker section becomes a "question" with empty "answer"
+            stripped = (text.strip() for text in matches)
+            return [(text, "") for text in stripped if text]
         else:
             # Conversation format - use base class implementation for Person1/Person2
             return super().split_qa(input_text, ending_message, supported_tags)
@@ -1,29 +1,45 @@
 """Google Cloud Text-to-Speech provider implementation."""
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from google.cloud import texttospeech_v1
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from ..base import TTSProvider
+from ...utils.audio import MP3_EXPORT_PARAMETERS, can_concat_mp3, concat_mp3, join_segments
+from ._google import shared_client, synthesize_all, utf8_len
+import os
 import re
 import logging
 from io import BytesIO
-from pydub import AudioSegment
 
 logger = logging.getLogger(__name__)
 
+# Speaker tag and content of a tagged section
+_SECTION_RE = re.compile(r'<((?:Person[12]|Speaker))>(.*?)</(?:Person[12]|Speaker)>', re.DOTALL)
+# Sentence-ending punctuation with its trailing whitespace
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+(?:\s+|$)')
+
+# Maximum concurrent ffmpeg decodes when merging chunks through pydub
+MAX_DECODE_WORKERS = min(8, os.cpu_count() or 1)
+
 class GeminiMultiTTS(TTSProvider):
     """Google Cloud Text-to-Speech provider with multi-speaker support."""
     
-    def __init__(self, api_key: str = None, model: str = "en-US-Studio-MultiSpeaker"):
+    def __init__(self, api_key: str = None, model: str = "en-US-Studio-MultiSpeaker",
+                 export_parameters: Optional[List[str]] = None):
         """
         Initialize Google Cloud TTS provider.
         
         Args:
             api_key (str): Google Cloud API key
+            export_parameters (Optional[List[str]]): ffmpeg encoder options used when merged
+                audio has to be re-encoded; defaults to MP3_EXPORT_PARAMETERS (VBR)
         """
         self.model = model
+        self.export_parameters = export_parameters or MP3_EXPORT_PARAMETERS
         try:
-            # Use Application Default Credentials
-            self.client = texttospeech_v1.TextToSpeechClient()
+            # Use Application Default Credentials; the client and its channel are shared process-wide
+            self.client = shared_client(texttospeech_v1.TextToSpeechClient)
             logger.info("Successfully initialized GeminiMultiTTS client")
         except Exception as e:
             logger.error(f"Failed to initialize GeminiMultiTTS client: {str(e)}")
@@ -42,37 +58,31 @@ class GeminiMultiTTS(TTSProvider):
         """
         logger.info(f"\nStarting chunk_text with text length: {len(text)} bytes")
         
-        # Split text into tagged sections, preserving both Person1/Person2 and Speaker tags
-        pattern = r'(<(?:Person[12]|Speaker)>.*?</(?:Person[12]|Speaker)>)'
-        sections = re.split(pattern, text, flags=re.DOTALL)
-        sections = [s.strip() for s in sections if s.strip()]
-        logger.info(f"Split text into {len(sections)} sections")
-        
         chunks = []
         current_chunk = ""
+        # UTF-8 size of current_chunk, kept running so the growing chunk is never re-encoded
+        current_bytes = 0
         
-        for section in sections:
-            # Extract speaker tag and content if this is a tagged section
-            tag_match = re.match(r'<((?:Person[12]|Speaker))>(.*?)</(?:Person[12]|Speaker)>', section, flags=re.DOTALL)
+        # Walk the tagged sections (Person1/Person2 or Speaker) in one pass; untagged text between them is dropped
+        num_sections = 0
+        for tag_match in _SECTION_RE.finditer(text):
+            num_sections += 1
+            speaker_tag = tag_match.group(1)  # Will be Person1, Person2, or Speaker
+            content = tag_match.group(2).strip()
+            tagged = f"<{speaker_tag}>{content}</{speaker_tag}>"
+            tagged_bytes = utf8_len(tagged)
             
-            if tag_match:
-                speaker_tag = tag_match.group(1)  # Will be Person1, Person2, or Speaker
-                content = tag_match.group(2).strip()
-                
-                # Test if adding this entire section would exceed limit
-                test_chunk = current_chunk
-                if current_chunk:
-                    test_chunk += f"<{speaker_tag}>{content}</{speaker_tag}>"
-                else:
-                    test_chunk = f"<{speaker_tag}>{content}</{speaker_tag}>"
-                    
-                if len(test_chunk.encode('utf-8')) > max_bytes and current_chunk:
-                    # Store current chunk and start new one
-                    chunks.append(current_chunk)
-                    current_chunk = f"<{speaker_tag}>{content}</{speaker_tag}>"
-                else:
-                    # Add to current chunk
-                    current_chunk = test_chunk
+            # Test if adding this entire section would exceed limit
+            if current_chunk and current_bytes + tagged_bytes > max_bytes:
+                # Store current chunk and start new one
+                chunks.append(current_chunk)
+                current_chunk = tagged
+                current_bytes = tagged_bytes
+            else:
+                # Add to current chunk
+                current_chunk += tagged
+                current_bytes += tagged_bytes
+        logger.info(f"Found {num_sections} tagged sections")
         
         # Add final chunk if it exists
         if current_chunk:
@@ -96,14 +106,16 @@ class GeminiMultiTTS(TTSProvider):
             return [text]
         
         chunks = []
-        sentences = re.split(r'([.!?]+(?:\s+|$))', text)
-        sentences = [s for s in sentences if s]
-        
         current_chunk = ""
-        for i in range(0, len(sentences), 2):
-            sentence = sentences[i]
-            separator = sentences[i + 1] if i + 1 < len(sentences) else ""
-            complete_sentence = sentence + separator
+        # Walk sentence spans: each ends after its punctuation and trailing whitespace,
+        # and any text after the last punctuation is a final sentence
+        pos = 0
+        sentence_ends = chain((m.end() for m in _SENTENCE_SPLIT_RE.finditer(text)), (len(text),))
+        for end in sentence_ends:
+            complete_sentence = text[pos:end]
+            pos = end
+            if not complete_sentence:
+                continue
             
             if len(current_chunk) + len(complete_sentence) > max_chars:
                 if current_chunk:
@@ -144,59 +156,56 @@ class GeminiMultiTTS(TTSProvider):
         if len(audio_chunks) == 1:
             return audio_chunks[0]
         
+        # Matching MP3 chunks are stream-copied frame by frame, with no PCM decode or re-encode
+        if can_concat_mp3(audio_chunks):
+            result = concat_mp3(audio_chunks)
+            logger.info(f"Joined {len(audio_chunks)} MP3 chunks without re-encoding: {len(result)/1024:.1f}KB")
+            return result
+        
+        # pydub is only needed on this fallback path, so it is not imported with the module
+        from pydub import AudioSegment
+        
         try:
-            # Initialize combined audio with first chunk
-            combined = None
-            valid_chunks = []
-            
-            for i, chunk in enumerate(audio_chunks):
+            def decode(indexed_chunk: Tuple[int, bytes]) -> Optional[AudioSegment]:
+                i, chunk = indexed_chunk
+                # Ensure chunk is not empty
+                if not chunk:
+                    logger.warning("Skipping empty chunk %d", i)
+                    return None
+                
+                # Decode straight from memory; BytesIO shares the chunk's buffer instead of copying it
                 try:
-                    # Ensure chunk is not empty
-                    if not chunk or len(chunk) == 0:
-                        logger.warning(f"Skipping empty chunk {i}")
-                        continue
-                    
-                    # Save chunk to temporary file for ffmpeg to process
-                    temp_file = f"temp_chunk_{i}.mp3"
-                    with open(temp_file, "wb") as f:
-                        f.write(chunk)
-                    
-                    # Create audio segment from temp file
-                    try:
-                        segment = AudioSegment.from_file(temp_file, format="mp3")
-                        if len(segment) > 0:
-                            valid_chunks.append(segment)
-                            logger.info(f"Successfully processed chunk {i}")
-                        else:
-                            logger.warning(f"Zero-length segment in chunk {i}")
-                    except Exception as e:
-                        logger.error(f"Error processing chunk {i}: {str(e)}")
-                    
-                    # Clean up temp file
-                    import os
-                    try:
-                        os.remove(temp_file)
-                    except Exception as e:
-                        logger.warning(f"Failed to remove temp file {temp_file}: {str(e)}")
-                    
+                    segment = AudioSegment.from_file(BytesIO(chunk), format="mp3")
                 except Exception as e:
-                    logger.error(f"Error handling chunk {i}: {str(e)}")
-                    continue
+                    logger.error(f"Error processing chunk {i}: {str(e)}")
+                    return None
+                if len(segment) == 0:
+                    logger.warning("Zero-length segment in chunk %d", i)
+                    return None
+                logger.info("Successfully processed chunk %d", i)
+                return segment
+            
+            # Each decode runs in an ffmpeg subprocess, so threads decode chunks in parallel
+            workers = min(MAX_DECODE_WORKERS, len(audio_chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                decoded = list(executor.map(decode, enumerate(audio_chunks)))
+            valid_chunks = [segment for segment in decoded if segment is not None]
             
             if not valid_chunks:
                 raise RuntimeError("No valid audio chunks to merge")
             
             # Merge valid chunks
-            logger.info(f"\nMerging {len(valid_chunks)} valid audio chunks...")
-            combined = valid_chunks[0]
-            total_duration = len(combined)/1000
-            logger.info(f"First chunk duration: {total_duration:.1f}s")
-            
-            for i, segment in enumerate(valid_chunks[1:], 2):
-                duration = len(segment)/1000
-                total_duration += duration
-                logger.info(f"Adding chunk {i}, duration: {duration:.1f}s (total: {total_duration:.1f}s)")
-                combined = combined + segment
+            logger.info("\nMerging %d valid audio chunks...", len(valid_chunks))
+            # Durations are only computed for the log, so skip them when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                total_duration = len(valid_chunks[0])/1000
+                logger.info("First chunk duration: %.1fs", total_duration)
+                
+                for i, segment in enumerate(valid_chunks[1:], 2):
+                    duration = len(segment)/1000
+                    total_duration += duration
+                    logger.info("Adding chunk %d, duration: %.1fs (total: %.1fs)", i, duration, total_duration)
+            combined = join_segments(valid_chunks)
             
             # Export with specific parameters
             logger.info("\nExporting final audio...")
@@ -205,14 +214,15 @@ class GeminiMultiTTS(TTSProvider):
                 output,
                 format="mp3",
                 codec="libmp3lame",
-                bitrate="320k"
+                parameters=self.export_parameters
             )
             
             result = output.getvalue()
             if len(result) == 0:
                 raise RuntimeError("Export produced empty output")
             
-            logger.info(f"Final audio size: {len(result)/1024:.1f}KB, duration: {total_duration:.1f}s")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Final audio size: %.1fKB, duration: %.1fs", len(result)/1024, len(combined)/1000)
             return result
             
         except Exception as e:
@@ -239,13 +249,14 @@ class GeminiMultiTTS(TTSProvider):
         """
         input_text = self.clean_tss_markup(input_text, supported_tags=supported_tags)
         
-        # Check if this is monologue format (Speaker tags)
-        if "<Speaker>" in input_text:
+        # Check if this is monologue format (Speaker tags); the scan resumes from the first tag
+        first_tag = input_text.find("<Speaker>")
+        if first_tag >= 0:
             # Split into Speaker sections
-            pattern = r"<Speaker>(.*?)</Speaker>"
-            matches = re.findall(pattern, input_text, re.DOTALL)
-            # For monologue, each Speaker section becomes a "question" with empty "answer"
-            return [(text.strip(), "") for text in matches]
+            matches = self.extract_tagged(input_text, "Speaker", first_tag)
+            # For monologue, each non-blank Speaker section becomes a "question" with empty "answer"
+            stripped = (text.strip() for text in matches)
+            return [(text, "") for text in stripped if text]
         else:
             # Conversation format - use base class implementation for Person1/Person2
             return super().split_qa(input_text, ending_message, supported_tags)
@@ -262,27 +273,28 @@ class GeminiMultiTTS(TTSProvider):
             # Split text into chunks if needed
             text_chunks = self.chunk_text(text)
             logger.info(f"Text split into {len(text_chunks)} chunks")
-            audio_chunks = []
+            synthesis_inputs = []
             
-            # Process each chunk
+            # Build the markup for each chunk
             for i, chunk in enumerate(text_chunks, 1):
-                logger.info(f"\nProcessing chunk {i}/{len(text_chunks)}")
+                logger.info("\nProcessing chunk %d/%d", i, len(text_chunks))
                 # Create multi-speaker markup
                 multi_speaker_markup = texttospeech_v1.MultiSpeakerMarkup()
                 
                 # Get pairs for this chunk
                 pairs = self.split_qa(chunk, "", self.get_supported_tags())
-                logger.info(f"Found {len(pairs)} pairs in chunk {i}")
+                logger.info("Found %d pairs in chunk %d", len(pairs), i)
                 
                 # Add turns for each pair
                 for j, (first_part, second_part) in enumerate(pairs, 1):
-                    logger.info(f"\nProcessing pair {j}/{len(pairs)} in chunk {i}")
+                    logger.info("\nProcessing pair %d/%d in chunk %d", j, len(pairs), i)
                     
-                    # Split first part into smaller chunks if needed
-                    first_chunks = self.split_turn_text(first_part.strip())
-                    logger.info(f"First part split into {len(first_chunks)} chunks")
+                    # Split first part into smaller chunks if needed, dropping blank ones,
+                    # which would only cost a request or fail it
+                    first_chunks = [c for c in self.split_turn_text(first_part.strip()) if c]
+                    logger.info("First part split into %d chunks", len(first_chunks))
                     for k, f_chunk in enumerate(first_chunks, 1):
-                        logger.info(f"Adding first turn {k}/{len(first_chunks)}: '{f_chunk[:50]}...' (length: {len(f_chunk)})")
+                        logger.info("Adding first turn %d/%d: '%.50s...' (length: %d)", k, len(first_chunks), f_chunk, len(f_chunk))
                         f_turn = texttospeech_v1.MultiSpeakerMarkup.Turn()
                         f_turn.text = f_chunk
                         f_turn.speaker = voice
@@ -290,43 +302,47 @@ class GeminiMultiTTS(TTSProvider):
                     
                     # Only process second part if it exists (will be empty for monologue format)
                     if second_part:
-                        second_chunks = self.split_turn_text(second_part.strip())
-                        logger.info(f"Second part split into {len(second_chunks)} chunks")
+                        second_chunks = [c for c in self.split_turn_text(second_part.strip()) if c]
+                        logger.info("Second part split into %d chunks", len(second_chunks))
                         for k, s_chunk in enumerate(second_chunks, 1):
-                            logger.info(f"Adding second turn {k}/{len(second_chunks)}: '{s_chunk[:50]}...' (length: {len(s_chunk)})")
+                            logger.info("Adding second turn %d/%d: '%.50s...' (length: %d)", k, len(second_chunks), s_chunk, len(s_chunk))
                             s_turn = texttospeech_v1.MultiSpeakerMarkup.Turn()
                             s_turn.text = s_chunk
                             s_turn.speaker = voice2
                             multi_speaker_markup.turns.append(s_turn)
                 
-                logger.info(f"Created markup with {len(multi_speaker_markup.turns)} turns")
+                logger.info("Created markup with %d turns", len(multi_speaker_markup.turns))
+                if not multi_speaker_markup.turns:
+                    logger.info("Skipping chunk %d: no text to synthesize", i)
+                    continue
                 
                 # Create synthesis input with multi-speaker markup
-                synthesis_input = texttospeech_v1.SynthesisInput(
+                synthesis_inputs.append(texttospeech_v1.SynthesisInput(
                     multi_speaker_markup=multi_speaker_markup
-                )
-                
-                logger.info("\nCalling synthesize_speech API...")
-                # Set voice parameters
-                voice_params = texttospeech_v1.VoiceSelectionParams(
-                    language_code="en-US",
-                    name=model
-                )
-                
-                # Set audio config
-                audio_config = texttospeech_v1.AudioConfig(
-                    audio_encoding=texttospeech_v1.AudioEncoding.MP3
-                )
-                
-                # Generate speech for this chunk
-                response = self.client.synthesize_speech(
-                    input=synthesis_input,
-                    voice=voice_params,
-                    audio_config=audio_config
-                )
-
-                audio_chunks.append(response.audio_content)
-            return audio_chunks
+                ))
+            
+            if not synthesis_inputs:
+                return []
+            
+            # Voice and audio settings are the same for every chunk
+            voice_params = texttospeech_v1.VoiceSelectionParams(
+                language_code="en-US",
+                name=model
+            )
+            audio_config = texttospeech_v1.AudioConfig(
+                audio_encoding=texttospeech_v1.AudioEncoding.MP3
+            )
+            
+            requests = [
+                dict(input=synthesis_input, voice=voice_params, audio_config=audio_config)
+                for synthesis_input in synthesis_inputs
+            ]
+            
+            # Chunks are independent network requests; results come back in chunk order
+            logger.info(f"\nCalling synthesize_speech API for {len(requests)} chunks...")
+            return synthesize_all(
+                self.client, texttospeech_v1.TextToSpeechAsyncClient, requests, cache=self.audio_cache
+            )
             
         except Exception as e:
             logger.error(f"Failed to generate audio: {str(e)}", exc_info=True)
@@ -2,8 +2,22 @@
 
 import requests
 import re
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional
 from ..base import TTSProvider
+from ...utils.cache import AudioCache
+
+# A Person1 or Person2 turn; group 1 or group 2 holds its text
+_PERSON_RE = re.compile(r'<Person1>(.*?)</Person1>|<Person2>(.*?)</Person2>', re.DOTALL)
+# Maximum segment requests in flight per generate_audio call
+MAX_REQUEST_WORKERS = 8
+# Longest text sent in one request when merging consecutive same-voice parts. The local
+# NovelAI server documents no input limit, so this stays well below the 4096-character
+# 'input' limit of the OpenAI /v1/audio/speech API it mirrors (OpenAI API reference).
+# Turns longer than this are still sent, just not merged with their neighbours
+MAX_INPUT_CHARS = 1000
 
 class NovelAITTS(TTSProvider):
     """Novel AI Text-to-Speech provider."""
@@ -18,44 +32,92 @@ class NovelAITTS(TTSProvider):
         """
         self.base_url = "http://localhost:8001/v1"
         self.model = model
+        # Keep connections to the server alive across segments, with a pool
+        # large enough for every concurrent request. Connection errors and
+        # transient 5xx responses are retried; synthesis has no side effects,
+        # so retrying the POST is safe
+        self._session = requests.Session()
+        retries = Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def _post_segment(self, model: str, text_part: str, voice_part: str) -> bytes:
+        """Synthesize one segment, reusing cached audio when an audio cache is set.
+        
+        Args:
+            model: Model name
+            text_part: Text to speak
+            voice_part: Voice to speak it with
+            
+        Returns:
+            Audio data for the segment
+            
+        Raises:
+            RuntimeError: If the server does not return audio
+        """
+        key = None
+        if self.audio_cache is not None:
+            # The server URL is part of the key, since different servers may render differently
+            key = AudioCache.make_key(*(
+                part.encode('utf-8') for part in (self.base_url, model, voice_part, text_part)
+            ))
+            cached = self.audio_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        response = self._session.post(
+            f"{self.base_url}/audio/speech",
+            json={
+                "model": model,
+                "input": text_part,
+                "voice": voice_part
+            }
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"API error: {response.text}")
+        if key is not None:
+            self.audio_cache.set(key, response.content)
+        return response.content
             
     def generate_audio(self, text: str, voice: str, model: str, voice2: str = None) -> bytes:
         """Generate audio using Novel AI API with support for two voices."""
         self.validate_parameters(text, voice, model)
+        # Fail before any work when there is nothing to synthesize
+        if not _PERSON_RE.search(text):
+            raise ValueError("Text must contain <Person1> or <Person2> tags")
         
         try:
-            # Split text into Person1 and Person2 parts using regex
+            # Split text into (voice, text) parts for Person1 and Person2 using regex
             parts = []
             
-            # Extract text between Person tags using regex
-            pattern = r'<Person1>(.*?)</Person1>|<Person2>(.*?)</Person2>'
-            matches = re.finditer(pattern, text, re.DOTALL)
+            # Extract text between Person tags using regex; each match fills exactly one group
+            person2_voice = voice2 or "Aini"
+            for person1, person2 in (match.groups() for match in _PERSON_RE.finditer(text)):
+                if person1 is not None:
+                    part_voice, text_part = voice, person1.strip()
+                else:
+                    part_voice, text_part = person2_voice, person2.strip()
+                if text_part:
+                    parts.append((part_voice, text_part))
             
-            for match in matches:
-                if match.group(1) is not None:  # Person1
-                    text_part = match.group(1).strip()
-                    if text_part:
-                        parts.append((text_part, voice))
-                elif match.group(2) is not None:  # Person2
-                    text_part = match.group(2).strip()
-                    if text_part:
-                        parts.append((text_part, voice2 or "Aini"))
+            # Consecutive parts with the same voice need only one request
+            parts = self.merge_consecutive_turns(parts, MAX_INPUT_CHARS)
             
-            # Generate audio for each part
+            # Generate audio for each part; requests are network-bound, so they run
+            # concurrently and map keeps the results in transcript order
             audio_parts = []
-            for text_part, voice_part in parts:
-                response = requests.post(
-                    f"{self.base_url}/audio/speech",
-                    json={
-                        "model": model,
-                        "input": text_part,
-                        "voice": voice_part
-                    }
-                )
-                if response.status_code == 200:
-                    audio_parts.append(response.content)
-                else:
-                    raise RuntimeError(f"API error: {response.text}")
+            if parts:
+                with ThreadPoolExecutor(max_workers=min(MAX_REQUEST_WORKERS, len(parts))) as executor:
+                    audio_parts = list(executor.map(
+                        lambda part: self._post_segment(model, text_part=part[1], voice_part=part[0]), parts
+                    ))
                     
             # Combine all audio parts
             if not audio_parts:
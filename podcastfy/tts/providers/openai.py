@@ -1,11 +1,76 @@
 """OpenAI TTS provider implementation."""
 
+import asyncio
 import openai
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from ..base import TTSProvider
+from ...utils.audio import MP3_EXPORT_PARAMETERS, can_concat_mp3, concat_mp3, join_segments
+from ...utils.cache import AudioCache
 import re
 import io
-from pydub import AudioSegment
+
+# A Person1 or Person2 turn; group 1 or group 2 holds its text
+_PERSON_RE = re.compile(r'<Person1>(.*?)</Person1>|<Person2>(.*?)</Person2>', re.DOTALL)
+# Literal speaker tags stripped from single-voice input, matched in one pass
+_SPEAKER_TAGS = ('<Speaker>', '</Speaker>', '<Person1>', '</Person1>', '<Person2>', '</Person2>')
+_SPEAKER_TAG_RE = re.compile('|'.join(map(re.escape, _SPEAKER_TAGS)))
+# Maximum speech requests in flight per generate_audio call
+MAX_REQUEST_WORKERS = 8
+# Input length limit of the speech endpoint
+MAX_INPUT_CHARS = 4096
+
+
+async def _create_speech_async(requests: List[Dict[str, Any]], max_concurrency: int) -> List[bytes]:
+    """
+    Run speech requests on an async client with bounded concurrency.
+    
+    Args:
+        requests: Keyword arguments for each audio.speech.create call
+        max_concurrency: Maximum requests in flight
+        
+    Returns:
+        List[bytes]: Audio content for each request, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # The client's connection pool is bound to this event loop, so it is created and closed here
+    async with openai.AsyncOpenAI(api_key=openai.api_key) as client:
+        async def create(request: Dict[str, Any]) -> bytes:
+            async with semaphore:
+                response = await client.audio.speech.create(**request)
+            return response.content
+        
+        return list(await asyncio.gather(*(create(request) for request in requests)))
+
+
+def _dispatch_speech(requests: List[Dict[str, Any]]) -> List[bytes]:
+    """
+    Run independent speech requests concurrently, preserving their order.
+    
+    Requests go through AsyncOpenAI on a private event loop. When called from
+    inside a running event loop, a thread pool over the sync client is used instead.
+    
+    Args:
+        requests: Keyword arguments for each audio.speech.create call
+        
+    Returns:
+        List[bytes]: Audio content for each request, in input order
+    """
+    if not requests:
+        return []
+    if len(requests) == 1:
+        # Nothing to overlap, so skip the event loop and async client setup
+        return [openai.audio.speech.create(**requests[0]).content]
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_create_speech_async(requests, MAX_REQUEST_WORKERS))
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_REQUEST_WORKERS, len(requests))) as executor:
+        return list(executor.map(
+            lambda request: openai.audio.speech.create(**request).content, requests
+        ))
+
 
 class OpenAITTS(TTSProvider):
     """OpenAI Text-to-Speech provider."""
@@ -31,69 +96,87 @@ class OpenAITTS(TTSProvider):
         """Get all supported SSML tags including provider-specific ones."""
         return self.PROVIDER_SSML_TAGS
         
+    @staticmethod
+    def _cache_key(request: Dict[str, Any]) -> str:
+        """Build an audio cache key from the model, voice and input of a speech request."""
+        return AudioCache.make_key(b"openai", *(
+            str(request[field]).encode('utf-8') for field in ("model", "voice", "input")
+        ))
+        
+    def _create_speech(self, requests: List[Dict[str, Any]]) -> List[bytes]:
+        """
+        Run independent speech requests concurrently, preserving their order.
+        
+        When an audio cache is set, only requests missing from it are sent.
+        
+        Args:
+            requests: Keyword arguments for each audio.speech.create call
+            
+        Returns:
+            List[bytes]: Audio content for each request, in input order
+        """
+        if self.audio_cache is None:
+            return _dispatch_speech(requests)
+        
+        keys = [self._cache_key(request) for request in requests]
+        audio: List[Optional[bytes]] = [self.audio_cache.get(key) for key in keys]
+        missing = [i for i, data in enumerate(audio) if data is None]
+        fresh = _dispatch_speech([requests[i] for i in missing])
+        for i, data in zip(missing, fresh):
+            self.audio_cache.set(keys[i], data)
+            audio[i] = data
+        return audio
+        
     def generate_audio(self, text: str, voice: str = "echo", model: str = None, voice2: str = None) -> bytes:
         """Generate audio using OpenAI API."""
         self.validate_parameters(text, voice, model or self.model)
         
         try:
-            # For conversation format, use different voices for Person1 and Person2
+            # For conversation format, use different voices for Person1 and Person2;
+            # without voice2, tagged text falls through to the single-voice branch
             if "<Person1>" in text and voice2:
-                # Extract Person1 and Person2 content
-                person1_pattern = r'<Person1>(.*?)</Person1>'
-                person2_pattern = r'<Person2>(.*?)</Person2>'
-                
-                person1_matches = re.findall(person1_pattern, text, re.DOTALL)
-                person2_matches = re.findall(person2_pattern, text, re.DOTALL)
-                
-                # Generate audio for Person1 content
-                person1_audio = []
-                for content in person1_matches:
-                    response = openai.audio.speech.create(
-                        model=model or self.model,
-                        voice=voice,
-                        input=content.strip()
-                    )
-                    person1_audio.append(response.content)
+                # Extract Person1 and Person2 turns in transcript order, in one pass
+                turns = [
+                    (voice, match.group(1).strip()) if match.group(1) is not None
+                    else (voice2, match.group(2).strip())
+                    for match in _PERSON_RE.finditer(text)
+                ]
+                # Blank turns would be sent as empty inputs, which the API rejects
+                turns = [(turn_voice, content) for turn_voice, content in turns if content]
+                if not turns:
+                    raise ValueError("No non-blank <Person1> or <Person2> turns found")
+                # Consecutive turns with the same voice need only one request
+                turns = self.merge_consecutive_turns(turns, MAX_INPUT_CHARS)
                 
-                # Generate audio for Person2 content
-                person2_audio = []
-                for content in person2_matches:
-                    response = openai.audio.speech.create(
-                        model=model or self.model,
-                        voice=voice2,
-                        input=content.strip()
-                    )
-                    person2_audio.append(response.content)
+                # Generate audio for each turn with its speaker's voice; the requests
+                # are network-bound and independent, so they are all in flight together
+                ordered_audio = self._create_speech([
+                    dict(model=model or self.model, voice=turn_voice, input=content)
+                    for turn_voice, content in turns
+                ])
                 
-                # Merge audio segments alternating between Person1 and Person2
-                combined = AudioSegment.empty()
-                for p1, p2 in zip(person1_audio, person2_audio):
-                    # Add Person1 audio
-                    segment = AudioSegment.from_file(io.BytesIO(p1))
-                    combined += segment
-                    # Add Person2 audio
-                    segment = AudioSegment.from_file(io.BytesIO(p2))
-                    combined += segment
+                # OpenAI returns MP3, so matching turns are joined frame by frame without re-encoding
+                if can_concat_mp3(ordered_audio):
+                    return concat_mp3(ordered_audio)
                 
-                # Handle any remaining Person1 audio
-                if len(person1_audio) > len(person2_audio):
-                    segment = AudioSegment.from_file(io.BytesIO(person1_audio[-1]))
-                    combined += segment
+                # Otherwise decode once per turn, join once, and encode a single stream;
+                # pydub is only needed on this path
+                from pydub import AudioSegment
+                combined = join_segments([
+                    AudioSegment.from_file(io.BytesIO(chunk)) for chunk in ordered_audio
+                ])
                 
                 # Export combined audio
                 output = io.BytesIO()
-                combined.export(output, format="mp3", codec="libmp3lame", bitrate="320k")
+                combined.export(output, format="mp3", codec="libmp3lame", parameters=MP3_EXPORT_PARAMETERS)
                 return output.getvalue()
                 
             else:
                 # For monologue format or when no voice2 provided, use single voice
-                cleaned_text = re.sub(r'</?(?:Speaker|Person[12])>', '', text)
-                response = openai.audio.speech.create(
-                    model=model or self.model,
-                    voice=voice,
-                    input=cleaned_text
-                )
-                return response.content
+                cleaned_text = _SPEAKER_TAG_RE.sub('', text)
+                return self._create_speech([
+                    dict(model=model or self.model, voice=voice, input=cleaned_text)
+                ])[0]
                 
         except Exception as e:
             raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
@@ -0,0 +1,207 @@
+"""
+Audio Module
+
+This module provides helpers for assembling audio returned by TTS providers.
+MP3 streams are sequences of self-contained frames, so MP3 chunks can be joined
+at the byte level instead of being decoded to PCM and encoded again.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+# LAME VBR quality used when MP3 audio has to be re-encoded. Speech at -q:a 4
+# (about 165 kbps) is indistinguishable from the TTS source, at half the size of 320k CBR.
+MP3_EXPORT_PARAMETERS = ["-q:a", "4"]
+
+
+def _id3v2_size(chunk: bytes) -> int:
+	"""
+	Get the size of a leading ID3v2 tag.
+
+	Args:
+		chunk (bytes): MP3 data.
+
+	Returns:
+		int: Number of bytes taken by the tag, or 0 if the chunk has none.
+	"""
+	if len(chunk) < 10 or chunk[:3] != b'ID3':
+		return 0
+	# Tag size is a 28-bit syncsafe integer that excludes the 10-byte header
+	size = (chunk[6] << 21) | (chunk[7] << 14) | (chunk[8] << 7) | chunk[9]
+	if chunk[5] & 0x10:  # Footer present
+		size += 10
+	return 10 + size
+
+
+def mp3_stream_format(chunk: bytes) -> Optional[Tuple[int, int, int]]:
+	"""
+	Read the stream format from the first MPEG audio frame header.
+
+	Args:
+		chunk (bytes): Audio data, optionally starting with an ID3v2 tag.
+
+	Returns:
+		Optional[Tuple[int, int, int]]: (MPEG version bits, sample rate index, channels),
+			or None if the data does not start with an MPEG Layer III frame.
+	"""
+	offset = _id3v2_size(chunk)
+	header = chunk[offset:offset + 4]
+	if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+		return None
+	version = (header[1] >> 3) & 0x03
+	layer = (header[1] >> 1) & 0x03
+	bitrate_index = header[2] >> 4
+	sample_rate_index = (header[2] >> 2) & 0x03
+	# Version 01 and sample rate index 11 are reserved; layer 01 is Layer III
+	if version == 0x01 or layer != 0x01 or bitrate_index == 0x0F or sample_rate_index == 0x03:
+		return None
+	channels = 1 if header[3] >> 6 == 0x03 else 2
+	return version, sample_rate_index, channels
+
+
+# Layer III bitrates in kbps by bitrate index, for MPEG-1 and for MPEG-2/2.5
+_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+# Sample rates in Hz by sample rate index, keyed by MPEG version bits (00 = 2.5, 10 = 2, 11 = 1)
+_SAMPLE_RATES = {0x00: (11025, 12000, 8000), 0x02: (22050, 24000, 16000), 0x03: (44100, 48000, 32000)}
+# Size of a trailing ID3v1 tag
+_ID3V1_SIZE = 128
+
+
+def _header_frame_size(chunk: bytes, offset: int) -> int:
+	"""
+	Get the size of a Xing/Info or VBRI header frame at an offset.
+
+	Encoders (LAME, and so ffmpeg and most TTS APIs) put a silent frame carrying
+	the stream's frame count, byte size and seek table before the audio. The
+	counts describe only that stream, so the frame is wrong once streams are joined.
+
+	Args:
+		chunk (bytes): MP3 data.
+		offset (int): Offset of the first MPEG frame header.
+
+	Returns:
+		int: Size of the header frame, or 0 if the frame at offset is an audio frame.
+	"""
+	header = chunk[offset:offset + 4]
+	if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+		return 0
+	version = (header[1] >> 3) & 0x03
+	bitrate_index = header[2] >> 4
+	sample_rate_index = (header[2] >> 2) & 0x03
+	if version == 0x01 or bitrate_index in (0x00, 0x0F) or sample_rate_index == 0x03:
+		return 0
+	mpeg1 = version == 0x03
+	bitrate = (_BITRATES_V1 if mpeg1 else _BITRATES_V2)[bitrate_index] * 1000
+	sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+	padding = (header[2] >> 1) & 0x01
+	frame_size = (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+
+	# The Xing tag follows the side information, whose size depends on version and channels
+	mono = header[3] >> 6 == 0x03
+	side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+	crc = 0 if header[1] & 0x01 else 2
+	xing = offset + 4 + crc + side_info
+	if chunk[xing:xing + 4] in (b'Xing', b'Info'):
+		return frame_size
+	# The VBRI tag (Fraunhofer encoders) sits at a fixed offset
+	if chunk[offset + 36:offset + 40] == b'VBRI':
+		return frame_size
+	return 0
+
+
+def _audio_frames(chunk: bytes) -> memoryview:
+	"""
+	Get the audio frames of an MP3 chunk, without tags or a Xing/Info/VBRI header frame.
+
+	Args:
+		chunk (bytes): MP3 data.
+
+	Returns:
+		memoryview: View of the chunk's audio frames; no data is copied.
+	"""
+	start = _id3v2_size(chunk)
+	start += _header_frame_size(chunk, start)
+	end = len(chunk)
+	if end - start >= _ID3V1_SIZE and chunk[end - _ID3V1_SIZE:end - _ID3V1_SIZE + 3] == b'TAG':
+		end -= _ID3V1_SIZE
+	return memoryview(chunk)[start:end]
+
+
+def can_concat_mp3(chunks: Iterable[bytes]) -> bool:
+	"""
+	Check whether MP3 chunks share one stream format and can be joined as bytes.
+
+	Args:
+		chunks (Iterable[bytes]): Audio data from a TTS provider.
+
+	Returns:
+		bool: True if every non-empty chunk is MP3 with the same sample rate and channel count.
+	"""
+	formats = {mp3_stream_format(chunk) for chunk in chunks if chunk}
+	return len(formats) == 1 and None not in formats
+
+
+def concat_mp3(chunks: Iterable[bytes]) -> bytes:
+	"""
+	Concatenate MP3 chunks into a single MP3 stream without re-encoding.
+
+	A single chunk is returned unchanged. When joining several, only the first
+	chunk's leading ID3v2 tag is kept, so players do not see tag data in the
+	middle of the stream. Xing/Info/VBRI header frames and trailing ID3v1 tags
+	are dropped from every chunk: their frame counts and seek tables describe
+	one chunk, and would make players report the wrong duration and seek badly.
+	Without them, players measure the joined stream themselves.
+
+	Args:
+		chunks (Iterable[bytes]): MP3 data in playback order.
+
+	Returns:
+		bytes: Combined MP3 data.
+	"""
+	chunks = [chunk for chunk in chunks if chunk]
+	if len(chunks) == 1:
+		return bytes(chunks[0])
+	parts = []
+	for chunk in chunks:
+		if not parts:
+			tag_size = _id3v2_size(chunk)
+			if tag_size:
+				parts.append(memoryview(chunk)[:tag_size])
+		parts.append(_audio_frames(chunk))
+	# The result is allocated once and each chunk's frames are copied into it exactly once
+	return b''.join(parts)
+
+
+def join_segments(segments: List["AudioSegment"]) -> "AudioSegment":
+	"""
+	Join decoded audio segments with a single copy of their sample data.
+
+	Repeated ``combined += segment`` copies the growing buffer on every step.
+	Instead, segments are brought to a common sample format (the highest frame
+	rate, channel count and sample width among them, as pydub's own addition
+	does) and their raw data is concatenated once.
+
+	Args:
+		segments (List[AudioSegment]): Decoded segments in playback order.
+
+	Returns:
+		AudioSegment: Combined audio.
+	"""
+	from pydub import AudioSegment
+
+	if not segments:
+		return AudioSegment.empty()
+	frame_rate = max(s.frame_rate for s in segments)
+	channels = max(s.channels for s in segments)
+	sample_width = max(s.sample_width for s in segments)
+	data = []
+	for segment in segments:
+		# Each conversion is a no-op when the segment already has the target format
+		segment = segment.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(sample_width)
+		data.append(segment.raw_data)
+	return AudioSegment(
+		data=b''.join(data),
+		sample_width=sample_width,
+		frame_rate=frame_rate,
+		channels=channels
+	)
@@ -0,0 +1,185 @@
+"""
+Response Cache Module
+
+This module provides small persistent caches for LLM responses and synthesized audio.
+LLM responses are keyed by a BLAKE2b hash of the fully rendered prompt, so regenerating
+a podcast from the same input and settings returns the stored response instead of
+calling the LLM again. Audio is keyed by a SHA-256 hash of the TTS request, so unchanged
+segments are not synthesized twice.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+
+class ResponseCache:
+	def __init__(self, path: str):
+		"""
+		Initialize the ResponseCache, creating the SQLite store if needed.
+
+		Args:
+			path (str): Path to the SQLite database file.
+		"""
+		directory = os.path.dirname(path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		self.path = path
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(path, check_same_thread=False)
+		with self._lock, self._conn:
+			self._conn.execute(
+				"CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+			)
+
+	@staticmethod
+	def make_key(*parts: str) -> str:
+		"""
+		Build a cache key from one or more strings.
+
+		Args:
+			*parts (str): Strings identifying the request (e.g. model name, rendered prompt).
+
+		Returns:
+			str: Hex digest identifying the request.
+		"""
+		digest = hashlib.blake2b(digest_size=32)
+		for part in parts:
+			digest.update(part.encode('utf-8'))
+			digest.update(b'\0')
+		return digest.hexdigest()
+
+	def get(self, key: str) -> Optional[str]:
+		"""
+		Get a cached response.
+
+		Args:
+			key (str): Cache key from make_key.
+
+		Returns:
+			Optional[str]: The cached response, or None on a miss.
+		"""
+		with self._lock:
+			row = self._conn.execute(
+				"SELECT response FROM responses WHERE key = ?", (key,)
+			).fetchone()
+		return row[0] if row else None
+
+	def set(self, key: str, response: str) -> None:
+		"""
+		Store a response.
+
+		Args:
+			key (str): Cache key from make_key.
+			response (str): Response text to store.
+		"""
+		with self._lock, self._conn:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+				(key, response)
+			)
+
+
+class AudioCache:
+	def __init__(self, directory: str, max_size_bytes: int = 1024 * 1024 * 1024):
+		"""
+		Initialize the AudioCache, creating the cache directory if needed.
+
+		Each entry is stored as its own file. When the total size exceeds
+		max_size_bytes, the least recently used entries are removed.
+
+		Args:
+			directory (str): Directory holding the cached audio files.
+			max_size_bytes (int): Upper bound on the total size of cached audio.
+		"""
+		os.makedirs(directory, exist_ok=True)
+		self.directory = directory
+		self.max_size_bytes = max_size_bytes
+		self._lock = threading.Lock()
+		# Sizes of the entries on disk, so eviction does not rescan the directory
+		self._sizes: Dict[str, int] = {}
+		with os.scandir(directory) as it:
+			for entry in it:
+				if entry.is_file() and entry.name.endswith('.bin'):
+					self._sizes[entry.name[:-4]] = entry.stat().st_size
+		self._total = sum(self._sizes.values())
+
+	@staticmethod
+	def make_key(*parts: bytes) -> str:
+		"""
+		Build a cache key from the parts of a TTS request.
+
+		Args:
+			*parts (bytes): Serialized request fields (e.g. voice, audio config, input).
+
+		Returns:
+			str: Hex digest identifying the request.
+		"""
+		digest = hashlib.sha256()
+		for part in parts:
+			digest.update(len(part).to_bytes(8, 'big'))
+			digest.update(part)
+		return digest.hexdigest()
+
+	def _path(self, key: str) -> str:
+		"""Get the file path of an entry."""
+		return os.path.join(self.directory, f"{key}.bin")
+
+	def get(self, key: str) -> Optional[bytes]:
+		"""
+		Get cached audio, marking the entry as recently used.
+
+		Args:
+			key (str): Cache key from make_key.
+
+		Returns:
+			Optional[bytes]: The cached audio, or None on a miss.
+		"""
+		path = self._path(key)
+		try:
+			with open(path, 'rb') as f:
+				data = f.read()
+			os.utime(path)
+		except FileNotFoundError:
+			return None
+		return data
+
+	def set(self, key: str, data: bytes) -> None:
+		"""
+		Store audio, evicting least recently used entries if over the size bound.
+
+		Args:
+			key (str): Cache key from make_key.
+			data (bytes): Audio to store.
+		"""
+		path = self._path(key)
+		# Write to a private temp file and rename, so readers never see a partial entry
+		tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+		with open(tmp_path, 'wb') as f:
+			f.write(data)
+		os.replace(tmp_path, path)
+		with self._lock:
+			self._total += len(data) - self._sizes.get(key, 0)
+			self._sizes[key] = len(data)
+			if self._total > self.max_size_bytes:
+				self._evict()
+
+	def _evict(self) -> None:
+		"""Remove least recently used entries until the cache fits its size bound."""
+		by_age = []
+		for key in self._sizes:
+			try:
+				by_age.append((os.stat(self._path(key)).st_mtime, key))
+			except FileNotFoundError:
+				by_age.append((0.0, key))
+		by_age.sort()
+		for _, key in by_age:
+			if self._total <= self.max_size_bytes:
+				break
+			try:
+				os.remove(self._path(key))
+			except FileNotFoundError:
+				pass
+			self._total -= self._sizes.pop(key)
@@ -6,7 +6,9 @@ It uses environment variables to securely store and access API keys and other se
 and a YAML file for non-sensitive configuration settings.
 """
 
+import copy
 import os
+from functools import lru_cache
 from dotenv import load_dotenv, find_dotenv
 from typing import Any, Dict, Optional
 import yaml
@@ -37,6 +39,34 @@ def get_config_path(config_file: str = 'config.yaml'):
 		print(f"Error locating {config_file}: {str(e)}")
 		return None
 
+@lru_cache(maxsize=8)
+def _parse_yaml_file(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+	"""
+	Parse a YAML file. Cached per path and modification time.
+
+	Args:
+		config_path (str): Path to the YAML file.
+		mtime_ns (int): Modification time of the file, so edits invalidate the cache.
+
+	Returns:
+		Dict[str, Any]: The parsed YAML content.
+	"""
+	with open(config_path, 'r') as file:
+		return yaml.safe_load(file)
+
+def read_yaml_config(config_path: str) -> Dict[str, Any]:
+	"""
+	Read a YAML configuration file, reusing the parsed result while the file is unchanged.
+
+	Args:
+		config_path (str): Path to the YAML file.
+
+	Returns:
+		Dict[str, Any]: A private deep copy of the parsed content, safe to modify.
+	"""
+	parsed = _parse_yaml_file(config_path, os.stat(config_path).st_mtime_ns)
+	return copy.deepcopy(parsed)
+
 class Config:
 	def __init__(self, config_file: str = 'config.yaml'):
 		"""
@@ -59,8 +89,7 @@ class Config:
 		
 		config_path = get_config_path(config_file)
 		if config_path:
-			with open(config_path, 'r') as file:
-				self.config: Dict[str, Any] = yaml.safe_load(file)
+			self.config: Dict[str, Any] = read_yaml_config(config_path)
 		else:
 			print("Could not locate config.yaml")
 			self.config = {}
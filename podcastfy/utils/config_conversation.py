@@ -8,7 +8,8 @@ for the Podcastfy application. It uses a YAML file for conversation-specific con
 import os
 import sys
 from typing import Any, Dict, Optional, List
-import yaml
+
+from podcastfy.utils.config import read_yaml_config
 
 def get_conversation_config_path(config_file: str = 'conversation_config.yaml'):
 	"""
@@ -137,14 +138,9 @@ class ConversationConfig(NestedConfig):
 		Args:
 			config_conversation (Optional[Dict[str, Any]]): Configuration dictionary. If None, default config will be used.
 		"""
-		# Load default configuration
+		# Load default configuration (a private copy, safe to update)
 		self.config_conversation = self._load_default_config()
 		if config_conversation is not None:
-			import copy
-			
-			# Create a deep copy of the default configuration
-			self.config_conversation = copy.deepcopy(self.config_conversation)
-			
 			# Update the configuration with provided values
 			if isinstance(config_conversation, dict):
 				self._deep_update(self.config_conversation, config_conversation)
@@ -158,8 +154,7 @@ class ConversationConfig(NestedConfig):
 		"""Load the default configuration from conversation_config.yaml."""
 		config_path = get_conversation_config_path()
 		if config_path:
-			with open(config_path, 'r') as file:
-				return yaml.safe_load(file)
+			return read_yaml_config(config_path)
 		else:
 			raise FileNotFoundError("conversation_config.yaml not found")
 
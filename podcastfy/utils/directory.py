@@ -5,11 +5,15 @@ including recursive directory traversal and file type filtering.
 """
 
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Maximum directories listed concurrently during a recursive scan
+MAX_SCAN_WORKERS = 16
+
 class DirectoryProcessor:
     """Handles directory traversal and file filtering for content processing."""
     
@@ -28,6 +32,8 @@ class DirectoryProcessor:
             ext if ext.startswith('.') else f'.{ext}'.lower()
             for ext in file_types
         ]
+        # str.endswith checks a tuple of suffixes in one call
+        self._ext_tuple = None if self.file_types is None else tuple(self.file_types)
     
     def process_directory(self, directory_path: str) -> List[str]:
         """Get list of files matching criteria in directory.
@@ -41,22 +47,10 @@ class DirectoryProcessor:
         Raises:
             ValueError: If directory_path doesn't exist or isn't a directory
         """
-        if not os.path.exists(directory_path):
-            raise ValueError(f"Directory does not exist: {directory_path}")
-        if not os.path.isdir(directory_path):
-            raise ValueError(f"Path is not a directory: {directory_path}")
-            
-        matching_files = []
+        files = self.iter_files(directory_path)
         try:
-            if self.recursive:
-                for root, _, files in os.walk(directory_path):
-                    matching_files.extend(self._filter_files(root, files))
-            else:
-                files = os.listdir(directory_path)
-                matching_files.extend(self._filter_files(directory_path, files))
-                
             # Sort for consistent ordering
-            matching_files.sort()
+            matching_files = sorted(files)
             
             if not matching_files:
                 logger.warning(
@@ -74,29 +68,88 @@ class DirectoryProcessor:
             logger.error(f"Error processing directory {directory_path}: {str(e)}")
             raise
     
-    def _filter_files(self, root: str, files: List[str]) -> List[str]:
-        """Filter files by extension.
+    def iter_files(self, directory_path: str) -> Iterator[str]:
+        """Yield files matching criteria in directory as they are found, unsorted.
+        
+        Unlike process_directory, the first file is available before the walk
+        finishes, so consumers can start processing it right away.
+        
+        Args:
+            directory_path (str): Path to directory to process
+            
+        Returns:
+            Iterator[str]: Matching file paths, in traversal order
+            
+        Raises:
+            ValueError: If directory_path doesn't exist or isn't a directory
+        """
+        # Validated here rather than in the generator, so errors are raised on the call
+        if not os.path.exists(directory_path):
+            raise ValueError(f"Directory does not exist: {directory_path}")
+        if not os.path.isdir(directory_path):
+            raise ValueError(f"Path is not a directory: {directory_path}")
+        return self._walk(directory_path)
+    
+    def _walk(self, directory_path: str) -> Iterator[str]:
+        """Yield matching files under a directory; see iter_files."""
+        if self.recursive:
+            # Breadth-first walk; like os.walk, unreadable directories are skipped
+            # and symlinked directories are not descended into. Listing a directory
+            # is I/O-bound (and slow on network filesystems), so each level's
+            # directories are listed concurrently
+            with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+                level = [directory_path]
+                while level:
+                    next_level = []
+                    for subdirs, files in executor.map(self._scan_directory, level):
+                        next_level.extend(subdirs)
+                        yield from files
+                    level = next_level
+        else:
+            with os.scandir(directory_path) as it:
+                yield from self._filter_files(it)
+    
+    def _scan_directory(self, path: str) -> Tuple[List[str], List[str]]:
+        """List one directory.
+        
+        Args:
+            path (str): Directory to list
+            
+        Returns:
+            Tuple[List[str], List[str]]: Paths of its subdirectories (excluding symlinks)
+                and of its matching files; both empty if it cannot be read
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory: {str(e)}")
+            return [], []
+        subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+        return subdirs, self._filter_files(entries)
+    
+    def _filter_files(self, entries: Iterable[os.DirEntry]) -> List[str]:
+        """Filter directory entries by extension.
         
         Args:
-            root (str): Directory containing the files
-            files (List[str]): List of filenames to filter
+            entries (Iterable[os.DirEntry]): Entries of one directory, from os.scandir
             
         Returns:
             List[str]: List of full paths to matching files
         """
         matching = []
-        for filename in files:
+        for entry in entries:
+            filename = entry.name
             # Skip hidden files
             if filename.startswith('.'):
                 continue
                 
             # If no file_types specified, accept all files
             # Otherwise check if file extension matches any in file_types
-            if self.file_types is None or any(
-                filename.lower().endswith(ext) for ext in self.file_types
-            ):
-                full_path = os.path.join(root, filename)
-                if os.path.isfile(full_path):  # Verify it's a file
-                    matching.append(full_path)
+            if self._ext_tuple is None or filename.lower().endswith(self._ext_tuple):
+                # Verify it's a file; the entry's type usually comes from the
+                # directory listing, so this rarely needs a stat call
+                if entry.is_file():
+                    matching.append(entry.path)
                     
         return matching
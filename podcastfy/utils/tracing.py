@@ -0,0 +1,75 @@
+"""
+Tracing Module
+
+This module provides a thin wrapper around LangSmith's ``traceable`` decorator so
+that tracing is only applied when a LangSmith API key is configured. The key is
+checked when a wrapped function is called, so keys loaded after import (e.g. from
+a .env file by Config) are honoured. When tracing is disabled the original function
+is called directly.
+"""
+
+import functools
+import os
+from typing import Any, Callable, Dict
+
+# Inputs longer than this are replaced by a length marker in traced runs
+MAX_TRACED_INPUT_CHARS = 1000
+
+
+def _summarize_inputs(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace large string inputs with a short placeholder before they are traced.
+
+    Args:
+        inputs (Dict[str, Any]): Function inputs as captured by LangSmith.
+
+    Returns:
+        Dict[str, Any]: Inputs with oversized strings replaced by '<N chars>'.
+    """
+    return {
+        key: f"<{len(value)} chars>"
+        if isinstance(value, str) and len(value) > MAX_TRACED_INPUT_CHARS
+        else value
+        for key, value in inputs.items()
+    }
+
+
+def tracing_enabled() -> bool:
+    """
+    Check whether a LangSmith API key is configured in the environment.
+
+    Returns:
+        bool: True if LANGSMITH_API_KEY or LANGCHAIN_API_KEY is set.
+    """
+    return bool(os.environ.get("LANGSMITH_API_KEY") or os.environ.get("LANGCHAIN_API_KEY"))
+
+
+def maybe_traceable(name: str, **kwargs: Any) -> Callable[[Callable], Callable]:
+    """
+    Return a decorator that traces calls with LangSmith while tracing is enabled.
+
+    Args:
+        name (str): Run name reported to LangSmith.
+        **kwargs: Extra keyword arguments forwarded to ``traceable``.
+
+    Returns:
+        Callable[[Callable], Callable]: Decorator to apply to the traced function.
+    """
+    kwargs.setdefault("process_inputs", _summarize_inputs)
+
+    def decorator(func: Callable) -> Callable:
+        traced = None  # Built on the first traced call, so langsmith is only imported when needed
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **call_kwargs: Any) -> Any:
+            nonlocal traced
+            if not tracing_enabled():
+                return func(*args, **call_kwargs)
+            if traced is None:
+                from langsmith import traceable
+                traced = traceable(name=name, **kwargs)(func)
+            return traced(*args, **call_kwargs)
+
+        return wrapper
+
+    return decorator
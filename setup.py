@@ -1,12 +1,26 @@
 """Setup script for podcastfy package."""
 
+import os
+
 from setuptools import setup, find_packages
 
+# Opt-in: compile the pure-Python markup helpers with Cython for faster transcript
+# cleaning. Without PODCASTFY_COMPILE=1 the package installs as pure Python.
+ext_modules = []
+if os.environ.get("PODCASTFY_COMPILE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["podcastfy/templates/_markup.py"],
+        compiler_directives={"language_level": "3"},
+    )
+
 setup(
     name="podcastfy",
     version="0.4.1",
     packages=find_packages(),
     include_package_data=True,
+    ext_modules=ext_modules,
     package_data={
         "podcastfy": [
             "config.yaml",
@@ -0,0 +1,62 @@
+"""
+Unit tests for the UI's directory helpers in app.utils.directory.
+"""
+
+import os
+
+from app.utils.directory import combine_directory_texts
+
+
+def write(path, text: str) -> None:
+    """Write a text file as UTF-8."""
+    path.write_bytes(text.encode("utf-8"))
+
+
+def test_combine_skips_empty_and_whitespace_only_files(tmp_path):
+    write(tmp_path / "1.txt", "first\n")
+    write(tmp_path / "2.txt", "")
+    write(tmp_path / "3.txt", " \n\t 　\n")
+    write(tmp_path / "10.txt", "\n  latest  \n")
+
+    assert combine_directory_texts(str(tmp_path)) == ("latest\n\nfirst", False)
+
+
+def test_combine_strips_unicode_whitespace_like_str_strip(tmp_path):
+    # U+3000 and NBSP are stripped as str.strip() does, and do not count toward the budget
+    write(tmp_path / "10.txt", "\u3000\u00a0 é \n")
+    write(tmp_path / "1.txt", "b" * 20)
+    max_size = len("é".encode("utf-8")) + 20
+
+    assert combine_directory_texts(str(tmp_path), max_size=max_size) == (
+        "é\n\n" + "b" * 20,
+        False,
+    )
+    assert combine_directory_texts(str(tmp_path), max_size=max_size - 1) == ("é", True)
+
+
+def test_combine_stops_at_first_file_over_budget(tmp_path):
+    write(tmp_path / "1.txt", "old")
+    write(tmp_path / "2.txt", "x" * 50)
+    write(tmp_path / "3.txt", "new")
+
+    # Newest first: "new" fits, "x" * 50 does not, and older files are not read
+    assert combine_directory_texts(str(tmp_path), max_size=10) == ("new", True)
+    assert combine_directory_texts(str(tmp_path), max_size=56) == (
+        "new\n\n" + "x" * 50 + "\n\nold",
+        False,
+    )
+
+
+def test_combine_skips_empty_files_without_opening_them(tmp_path, monkeypatch):
+    write(tmp_path / "1.txt", "text")
+    write(tmp_path / "2.txt", "")
+    opened = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    assert combine_directory_texts(str(tmp_path)) == ("text", False)
+    assert [os.path.basename(p) for p in opened] == ["1.txt"]
@@ -0,0 +1,161 @@
+"""
+Unit tests for the MP3 helpers in podcastfy.utils.audio.
+
+Streams are built from synthetic MPEG-1 Layer III frames, so no encoder is needed.
+"""
+
+from pydub import AudioSegment
+
+from podcastfy.utils.audio import (
+    _id3v2_size,
+    can_concat_mp3,
+    concat_mp3,
+    join_segments,
+    mp3_stream_format,
+)
+
+# MPEG-1 Layer III, no CRC, 128 kbps, 44.1 kHz, no padding, stereo: 144 * 128000 // 44100 = 417 bytes
+HEADER = b"\xff\xfb\x90\x00"
+FRAME_SIZE = 417
+# MPEG-2 Layer III, no CRC, 64 kbps, 22.05 kHz, no padding, mono: 72 * 64000 // 22050 = 208 bytes
+HEADER_V2_MONO = b"\xff\xf3\x80\xc0"
+FRAME_SIZE_V2 = 208
+
+
+def audio_frame(fill: bytes, header: bytes = HEADER, size: int = FRAME_SIZE) -> bytes:
+    """Build an audio frame whose payload is filled with one byte."""
+    return header + fill * (size - len(header))
+
+
+def info_frame(
+    tag: bytes = b"Info",
+    header: bytes = HEADER,
+    size: int = FRAME_SIZE,
+    side_info: int = 32,
+) -> bytes:
+    """Build a Xing/Info header frame with its tag after the side information."""
+    frame = header + b"\x00" * side_info + tag + b"\x00\x00\x00\x0f"
+    return frame + b"\x00" * (size - len(frame))
+
+
+def vbri_frame() -> bytes:
+    """Build a VBRI header frame, whose tag sits 32 bytes after the frame header."""
+    frame = HEADER + b"\x00" * 32 + b"VBRI"
+    return frame + b"\x00" * (FRAME_SIZE - len(frame))
+
+
+def id3v2_tag(body: bytes = b"\x00" * 20, footer: bool = False) -> bytes:
+    """Build an ID3v2.4 tag around a body."""
+    size = len(body)
+    syncsafe = bytes(
+        [(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F]
+    )
+    flags = b"\x10" if footer else b"\x00"
+    tag = b"ID3\x04\x00" + flags + syncsafe + body
+    if footer:
+        tag += b"3DI\x04\x00" + flags + syncsafe
+    return tag
+
+
+ID3V1 = b"TAG" + b"\x00" * 125
+
+
+def test_id3v2_size():
+    assert _id3v2_size(id3v2_tag(b"x" * 300) + audio_frame(b"a")) == 310
+    assert _id3v2_size(id3v2_tag(b"x" * 300, footer=True)) == 320
+    assert _id3v2_size(audio_frame(b"a")) == 0
+    assert _id3v2_size(b"ID3") == 0
+
+
+def test_mp3_stream_format():
+    assert mp3_stream_format(audio_frame(b"a")) == (0x03, 0x00, 2)
+    assert mp3_stream_format(
+        id3v2_tag() + audio_frame(b"a", HEADER_V2_MONO, FRAME_SIZE_V2)
+    ) == (0x02, 0x00, 1)
+    # Reserved MPEG version, reserved sample rate, bad bitrate, Layer II, and no sync word
+    assert mp3_stream_format(b"\xff\xeb\x90\x00" + b"\x00" * 40) is None
+    assert mp3_stream_format(b"\xff\xfb\x9c\x00" + b"\x00" * 40) is None
+    assert mp3_stream_format(b"\xff\xfb\xf0\x00" + b"\x00" * 40) is None
+    assert mp3_stream_format(b"\xff\xfd\x90\x00" + b"\x00" * 40) is None
+    assert mp3_stream_format(b"RIFF" + b"\x00" * 40) is None
+    assert mp3_stream_format(b"") is None
+
+
+def test_can_concat_mp3():
+    v1 = audio_frame(b"a")
+    v2 = audio_frame(b"a", HEADER_V2_MONO, FRAME_SIZE_V2)
+    assert can_concat_mp3([v1, b"", id3v2_tag() + v1])
+    assert not can_concat_mp3([v1, v2])
+    assert not can_concat_mp3([v1, b"RIFF" + b"\x00" * 40])
+    assert not can_concat_mp3([])
+    assert not can_concat_mp3([b""])
+
+
+def test_concat_single_chunk_is_unchanged():
+    chunk = id3v2_tag() + info_frame() + audio_frame(b"a") + ID3V1
+    assert concat_mp3([b"", chunk]) == chunk
+
+
+def test_concat_drops_header_frames_and_tags():
+    first = id3v2_tag() + info_frame() + audio_frame(b"a") + ID3V1
+    second = (
+        id3v2_tag(footer=True)
+        + info_frame(b"Xing")
+        + audio_frame(b"b")
+        + audio_frame(b"c")
+        + ID3V1
+    )
+    third = vbri_frame() + audio_frame(b"d")
+
+    joined = concat_mp3([first, b"", second, third])
+
+    expected = id3v2_tag() + b"".join(
+        audio_frame(fill) for fill in (b"a", b"b", b"c", b"d")
+    )
+    assert joined == expected
+
+
+def test_concat_keeps_audio_frames_without_headers():
+    chunks = [audio_frame(b"a"), audio_frame(b"b") + audio_frame(b"c")]
+    assert concat_mp3(chunks) == b"".join(chunks)
+
+
+def test_concat_finds_xing_after_short_side_info():
+    # MPEG-2 mono side information is 9 bytes, not 32
+    header_frame = info_frame(header=HEADER_V2_MONO, size=FRAME_SIZE_V2, side_info=9)
+    frame = audio_frame(b"a", HEADER_V2_MONO, FRAME_SIZE_V2)
+    assert concat_mp3([header_frame + frame, header_frame + frame]) == frame + frame
+
+
+def test_concat_empty():
+    assert concat_mp3([]) == b""
+    assert concat_mp3([b"", b""]) == b""
+
+
+def pcm(data: bytes, sample_width: int, frame_rate: int, channels: int) -> AudioSegment:
+    """Build a segment from raw PCM data."""
+    return AudioSegment(
+        data=data, sample_width=sample_width, frame_rate=frame_rate, channels=channels
+    )
+
+
+def test_join_segments_matches_pydub_addition():
+    segments = [
+        pcm(b"\x01\x00" * 100, 2, 8000, 1),
+        pcm(b"\x02\x00\x03\x00" * 50, 2, 16000, 2),
+        pcm(b"\x05" * 30, 1, 8000, 1),
+    ]
+    joined = join_segments(segments)
+    added = segments[0] + segments[1] + segments[2]
+
+    assert (joined.frame_rate, joined.channels, joined.sample_width) == (16000, 2, 2)
+    assert joined.raw_data == added.raw_data
+
+
+def test_join_segments_same_format_is_plain_concatenation():
+    segments = [pcm(bytes([i]) * 40, 2, 24000, 1) for i in range(1, 4)]
+    assert join_segments(segments).raw_data == b"".join(s.raw_data for s in segments)
+
+
+def test_join_segments_empty():
+    assert len(join_segments([])) == 0
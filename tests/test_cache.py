@@ -0,0 +1,85 @@
+"""
+Unit tests for the persistent caches in podcastfy.utils.cache.
+"""
+
+import os
+
+from podcastfy.utils.cache import AudioCache, ResponseCache
+
+
+def test_response_cache_round_trip(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache" / "responses.sqlite"))
+    key = ResponseCache.make_key("model", "prompt")
+
+    assert cache.get(key) is None
+    cache.set(key, "first")
+    cache.set(key, "second")
+    assert cache.get(key) == "second"
+
+
+def test_response_cache_persists(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    key = ResponseCache.make_key("model", "prompt")
+    ResponseCache(path).set(key, "stored")
+
+    assert ResponseCache(path).get(key) == "stored"
+
+
+def test_response_cache_key_separates_parts():
+    assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+    assert ResponseCache.make_key("a", "b") == ResponseCache.make_key("a", "b")
+
+
+def age(cache: AudioCache, key: str, mtime: float) -> None:
+    """Set the last-used time of an audio cache entry."""
+    os.utime(cache._path(key), (mtime, mtime))
+
+
+def test_audio_cache_round_trip(tmp_path):
+    cache = AudioCache(str(tmp_path))
+    key = AudioCache.make_key(b"voice", b"hello")
+
+    assert cache.get(key) is None
+    cache.set(key, b"audio")
+    assert cache.get(key) == b"audio"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_audio_cache_key_separates_parts():
+    assert AudioCache.make_key(b"ab", b"c") != AudioCache.make_key(b"a", b"bc")
+
+
+def test_audio_cache_evicts_least_recently_used(tmp_path):
+    cache = AudioCache(str(tmp_path), max_size_bytes=25)
+    cache.set("a", b"x" * 10)
+    cache.set("b", b"x" * 10)
+    age(cache, "a", 1000)
+    age(cache, "b", 2000)
+    # Reading "a" makes it the most recently used entry
+    assert cache.get("a") is not None
+
+    cache.set("c", b"x" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"x" * 10
+    assert cache.get("c") == b"x" * 10
+    assert cache._total == 20
+
+
+def test_audio_cache_overwrite_updates_size(tmp_path):
+    cache = AudioCache(str(tmp_path), max_size_bytes=25)
+    cache.set("a", b"x" * 10)
+    cache.set("a", b"x" * 20)
+    assert cache._total == 20
+    assert cache.get("a") == b"x" * 20
+
+
+def test_audio_cache_counts_existing_entries(tmp_path):
+    AudioCache(str(tmp_path)).set("a", b"x" * 10)
+    cache = AudioCache(str(tmp_path), max_size_bytes=15)
+    age(cache, "a", 1000)
+
+    cache.set("b", b"x" * 10)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"x" * 10
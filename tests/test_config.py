@@ -0,0 +1,43 @@
+"""
+Unit tests for YAML loading in podcastfy.utils.config.
+"""
+
+import os
+
+from podcastfy.utils.config import read_yaml_config
+
+
+def write_yaml(path, text: str, mtime_ns: int) -> None:
+    """Write a YAML file and pin its modification time."""
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_read_yaml_config_returns_private_copies(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_yaml(path, "settings:\n  voices: [a, b]\n", 1_000_000_000)
+
+    first = read_yaml_config(str(path))
+    first["settings"]["voices"].append("c")
+    first["extra"] = True
+
+    assert read_yaml_config(str(path)) == {"settings": {"voices": ["a", "b"]}}
+
+
+def test_read_yaml_config_rereads_modified_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_yaml(path, "value: 1\n", 1_000_000_000)
+    assert read_yaml_config(str(path)) == {"value": 1}
+
+    write_yaml(path, "value: 2\n", 2_000_000_000)
+    assert read_yaml_config(str(path)) == {"value": 2}
+
+
+def test_read_yaml_config_reuses_parse_while_unchanged(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_yaml(path, "value: 1\n", 1_000_000_000)
+    assert read_yaml_config(str(path)) == {"value": 1}
+
+    # Same modification time, so the cached parse is still used
+    write_yaml(path, "value: 9\n", 1_000_000_000)
+    assert read_yaml_config(str(path)) == {"value": 1}
@@ -0,0 +1,148 @@
+"""
+Unit tests for long-form chunking in podcastfy.content_generator.
+"""
+
+import asyncio
+import os
+import random
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from podcastfy.content_generator import LongFormContentGenerator, _write_text_atomic
+from podcastfy.templates import ConversationTemplate
+
+
+@pytest.fixture
+def generator():
+    llm = RunnableLambda(lambda prompt: "")
+    return LongFormContentGenerator(None, llm, {}, ConversationTemplate())
+
+
+def greedy_chunk_spans(generator, input_content, chunk_size):
+    """The sentence-by-sentence scan that bisection replaced."""
+    spans = []
+    chunk_start = chunk_end = None
+    for start, end in zip(*generator._sentence_offsets(input_content)):
+        if chunk_start is None:
+            chunk_start = start
+        elif end - chunk_start > chunk_size:
+            spans.append((chunk_start, chunk_end))
+            chunk_start = start
+        chunk_end = end
+    if chunk_start is not None:
+        spans.append((chunk_start, chunk_end))
+    return spans
+
+
+def test_chunks_pack_whole_sentences(generator):
+    text = "One two. Three four. Five six. Seven."
+    assert list(generator.chunk_content(text, 20)) == [
+        "One two. Three four.",
+        "Five six. Seven.",
+    ]
+
+
+def test_oversized_sentence_is_its_own_chunk(generator):
+    text = "Short. " + "X" * 50 + ". Tail."
+    assert list(generator.chunk_content(text, 10)) == [
+        "Short.",
+        "X" * 50 + ".",
+        "Tail.",
+    ]
+
+
+def test_empty_input_has_no_chunks(generator):
+    assert list(generator.chunk_content("", 10)) == []
+
+
+def test_chunk_spans_match_greedy_scan_on_random_input(generator):
+    rng = random.Random(0)
+    for _ in range(300):
+        sentences = ["W" * rng.randint(1, 40) + "." for _ in range(rng.randint(0, 30))]
+        text = " ".join(sentences) + rng.choice(["", " trailing words"])
+        chunk_size = rng.randint(1, 120)
+        spans = list(generator._iter_chunk_spans(text, chunk_size))
+        assert spans == greedy_chunk_spans(generator, text, chunk_size)
+
+
+def sentences(generator, text):
+    """Split text with the long-form sentence boundary rule."""
+    return [text[start:end] for start, end in zip(*generator._sentence_offsets(text))]
+
+
+def test_sentences_end_on_terminal_punctuation(generator):
+    assert sentences(generator, "Really? Yes! Fine. Done") == [
+        "Really?",
+        "Yes!",
+        "Fine.",
+        "Done",
+    ]
+
+
+def test_sentences_do_not_split_before_lowercase_or_digit(generator):
+    text = "Use tools, e.g. the parser. See No. 5 for details."
+    assert sentences(generator, text) == [
+        "Use tools, e.g. the parser.",
+        "See No. 5 for details.",
+    ]
+
+
+def test_sentences_split_before_non_ascii_capitals(generator):
+    assert sentences(generator, "Fin. Élan vital.") == ["Fin.", "Élan vital."]
+
+
+def test_write_text_atomic_replaces_target(tmp_path):
+    path = tmp_path / "transcript.txt"
+    path.write_text("old")
+    _write_text_atomic(str(path), "<Person1>héllo</Person1>")
+
+    assert path.read_text(encoding="utf-8") == "<Person1>héllo</Person1>"
+    assert os.listdir(tmp_path) == ["transcript.txt"]
+
+
+def test_write_text_atomic_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "transcript.txt"
+    path.write_text("old")
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        _write_text_atomic(str(path), "new")
+
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["transcript.txt"]
+
+
+def test_concurrent_middle_chunks_label_source_context():
+    prompts = []
+
+    def record(prompt):
+        prompts.append(prompt.to_string())
+        return "<Person1>Response.</Person1>"
+
+    generator = LongFormContentGenerator(
+        None,
+        RunnableLambda(record),
+        {"min_chunk_size": 10, "max_num_chunks": 4, "context_tail_chars": 10},
+        ConversationTemplate(),
+    )
+    text = "First part here. Second part here. Third part here. Fourth part here."
+    params = {
+        "podcast_name": "Show",
+        "podcast_tagline": "Tagline",
+        "conversation_style": "casual",
+        "engagement_techniques": "questions",
+        "dialogue_structure": "intro",
+        "roles_person1": "host",
+        "roles_person2": "guest",
+        "output_language": "English",
+        "instructions": "",
+    }
+    asyncio.run(generator.agenerate_long_form(text, params))
+
+    third = next(p for p in prompts if "part 3 of" in p)
+    # The end of the second source chunk, trimmed to context_tail_chars characters
+    assert "Preceding source excerpt, covered by the previous part: part here." in third
@@ -0,0 +1,122 @@
+"""
+Unit tests for podcastfy.utils.directory.DirectoryProcessor.
+"""
+
+import os
+import random
+
+import pytest
+
+from podcastfy.utils.directory import DirectoryProcessor
+
+
+def walk_files(root, recursive, file_types):
+    """List matching files with os.walk and os.path.isfile, as the processor once did."""
+    if recursive:
+        listings = [(dirpath, files) for dirpath, _, files in os.walk(root)]
+    else:
+        listings = [(root, os.listdir(root))]
+    return sorted(
+        os.path.join(dirpath, name)
+        for dirpath, names in listings
+        for name in names
+        if not name.startswith(".")
+        and (
+            file_types is None or any(name.lower().endswith(ext) for ext in file_types)
+        )
+        and os.path.isfile(os.path.join(dirpath, name))
+    )
+
+
+def random_tree(root, rng):
+    """Populate a directory with files, hidden files, subdirectories and symlinks."""
+    (root / "first.txt").write_text("content")
+    dirs = [str(root)]
+    for i in range(rng.randint(5, 40)):
+        parent = rng.choice(dirs)
+        kind = rng.random()
+        name = rng.choice(["doc", ".hidden", "Notes", "x"]) + str(i)
+        path = os.path.join(parent, name)
+        if kind < 0.3:
+            os.mkdir(path)
+            dirs.append(path)
+        elif kind < 0.4:
+            os.symlink(rng.choice(dirs), path)
+        else:
+            with open(path + rng.choice([".txt", ".PDF", ".md", ""]), "w") as f:
+                f.write("content")
+
+
+@pytest.mark.parametrize("recursive", [False, True])
+@pytest.mark.parametrize("file_types", [None, [".txt", ".pdf"]])
+def test_process_directory_matches_os_walk_on_random_trees(
+    tmp_path, recursive, file_types
+):
+    rng = random.Random(0)
+    for i in range(20):
+        root = tmp_path / str(i)
+        root.mkdir()
+        random_tree(root, rng)
+        processor = DirectoryProcessor(recursive=recursive, file_types=file_types)
+        expected = walk_files(str(root), recursive, processor.file_types)
+        assert processor.process_directory(str(root)) == expected
+
+
+def test_process_directory_rejects_missing_or_file_paths(tmp_path):
+    processor = DirectoryProcessor()
+    with pytest.raises(ValueError):
+        processor.process_directory(str(tmp_path / "missing"))
+    (tmp_path / "file.txt").write_text("content")
+    with pytest.raises(ValueError):
+        processor.process_directory(str(tmp_path / "file.txt"))
+
+
+def test_recursive_scan_with_more_directories_than_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr("podcastfy.utils.directory.MAX_SCAN_WORKERS", 2)
+    level = tmp_path
+    for depth in range(6):
+        for branch in range(3):
+            (level / f"d{depth}{branch}").mkdir()
+            (level / f"d{depth}{branch}" / "file.txt").write_text("content")
+        level = level / f"d{depth}0"
+
+    processor = DirectoryProcessor(recursive=True, file_types=[".txt"])
+    assert processor.process_directory(str(tmp_path)) == walk_files(
+        str(tmp_path), True, [".txt"]
+    )
+    assert len(processor.process_directory(str(tmp_path))) == 18
+
+
+def test_repeated_scans_see_nested_changes(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_text("content")
+    processor = DirectoryProcessor(recursive=True, file_types=[".txt"])
+    assert processor.process_directory(str(tmp_path)) == [
+        str(tmp_path / "sub" / "a.txt")
+    ]
+
+    (tmp_path / "sub" / "deeper").mkdir()
+    (tmp_path / "sub" / "deeper" / "b.txt").write_text("content")
+    (tmp_path / "sub" / "a.txt").unlink()
+
+    assert processor.process_directory(str(tmp_path)) == [
+        str(tmp_path / "sub" / "deeper" / "b.txt")
+    ]
+
+
+@pytest.mark.parametrize("recursive", [False, True])
+def test_iter_files_yields_same_files_as_process_directory(tmp_path, recursive):
+    random_tree(tmp_path, random.Random(1))
+    processor = DirectoryProcessor(recursive=recursive, file_types=[".txt", ".pdf"])
+    assert sorted(processor.iter_files(str(tmp_path))) == processor.process_directory(
+        str(tmp_path)
+    )
+
+
+def test_iter_files_validates_path_on_call(tmp_path):
+    processor = DirectoryProcessor(recursive=True)
+    with pytest.raises(ValueError):
+        processor.iter_files(str(tmp_path / "missing"))
+    (tmp_path / "file.txt").write_text("content")
+    with pytest.raises(ValueError):
+        processor.iter_files(str(tmp_path / "file.txt"))
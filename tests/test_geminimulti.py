@@ -0,0 +1,135 @@
+"""
+Unit tests for the transcript splitting in podcastfy.tts.providers.geminimulti.
+"""
+
+import random
+import re
+
+import pytest
+
+from podcastfy.tts.providers.geminimulti import GeminiMultiTTS
+
+
+@pytest.fixture
+def tts():
+    # The splitting methods use no client state, so skip creating a Text-to-Speech client
+    return GeminiMultiTTS.__new__(GeminiMultiTTS)
+
+
+def split_chunk_text(text, max_bytes):
+    """The re.split implementation that chunk_text replaced."""
+    pattern = r"(<(?:Person[12]|Speaker)>.*?</(?:Person[12]|Speaker)>)"
+    sections = [
+        s.strip() for s in re.split(pattern, text, flags=re.DOTALL) if s.strip()
+    ]
+    chunks = []
+    current_chunk = ""
+    for section in sections:
+        tag_match = re.match(
+            r"<((?:Person[12]|Speaker))>(.*?)</(?:Person[12]|Speaker)>",
+            section,
+            flags=re.DOTALL,
+        )
+        if tag_match:
+            tagged = f"<{tag_match.group(1)}>{tag_match.group(2).strip()}</{tag_match.group(1)}>"
+            test_chunk = current_chunk + tagged
+            if len(test_chunk.encode("utf-8")) > max_bytes and current_chunk:
+                chunks.append(current_chunk)
+                current_chunk = tagged
+            else:
+                current_chunk = test_chunk
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def random_transcript(rng):
+    """Build a transcript of tagged turns with stray untagged text between them."""
+    words = ["hi", "héllo", "ok", "well", "\n", "  ", "x" * 30]
+    parts = []
+    for _ in range(rng.randint(0, 15)):
+        tag = rng.choice(["Person1", "Person2", "Speaker"])
+        content = " ".join(rng.choice(words) for _ in range(rng.randint(0, 10)))
+        parts.append(f"<{tag}>{content}</{tag}>")
+        if rng.random() < 0.3:
+            parts.append(rng.choice(["stray", "\n", " ", "<Person1>unclosed"]))
+    return "".join(parts)
+
+
+def test_chunk_text_keeps_tags_within_byte_limit(tts):
+    text = "<Person1>Hello there.</Person1> <Person2>Hi!</Person2>\n<Person1>Bye.</Person1>"
+    assert tts.chunk_text(text, max_bytes=60) == [
+        "<Person1>Hello there.</Person1><Person2>Hi!</Person2>",
+        "<Person1>Bye.</Person1>",
+    ]
+
+
+def test_chunk_text_matches_split_implementation_on_random_input(tts):
+    rng = random.Random(0)
+    for _ in range(500):
+        text = random_transcript(rng)
+        max_bytes = rng.randint(1, 200)
+        assert tts.chunk_text(text, max_bytes) == split_chunk_text(
+            text, max_bytes
+        ), text
+
+
+def split_turn_sentences(text, max_chars):
+    """The re.split implementation that split_turn_text replaced."""
+    if len(text) <= max_chars:
+        return [text]
+    chunks = []
+    sentences = [s for s in re.split(r"([.!?]+(?:\s+|$))", text) if s]
+    current_chunk = ""
+    for i in range(0, len(sentences), 2):
+        separator = sentences[i + 1] if i + 1 < len(sentences) else ""
+        complete_sentence = sentences[i] + separator
+        if len(current_chunk) + len(complete_sentence) > max_chars:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+                current_chunk = complete_sentence
+            else:
+                temp_chunk = ""
+                for word in complete_sentence.split():
+                    if len(temp_chunk) + len(word) + 1 > max_chars:
+                        chunks.append(temp_chunk.strip())
+                        temp_chunk = word
+                    else:
+                        temp_chunk += " " + word if temp_chunk else word
+                current_chunk = temp_chunk
+        else:
+            current_chunk += complete_sentence
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def test_split_turn_text_keeps_text_starting_with_punctuation(tts):
+    # The re.split version paired sentences with the wrong separators here
+    text = "... so. Then we left! " + "word " * 20
+    chunks = tts.split_turn_text(text, max_chars=40)
+    assert " ".join(chunks).split() == text.split()
+    assert chunks[0] == "... so. Then we left!"
+
+
+def test_split_turn_text_matches_split_implementation_on_random_input(tts):
+    rng = random.Random(0)
+    for _ in range(2000):
+        sentences = []
+        for _ in range(rng.randint(1, 12)):
+            words = " ".join(
+                rng.choice(["we", "talk", "about", "x" * 25])
+                for _ in range(rng.randint(1, 12))
+            )
+            sentences.append(
+                words
+                + rng.choice([".", "!", "?", "?!", "...", ""])
+                + rng.choice([" ", "  ", "\n"])
+            )
+        text = (
+            "".join(sentences).rstrip(" ") if rng.random() < 0.5 else "".join(sentences)
+        )
+        max_chars = rng.randint(20, 150)
+        assert tts.split_turn_text(text, max_chars) == split_turn_sentences(
+            text, max_chars
+        ), text
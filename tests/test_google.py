@@ -0,0 +1,38 @@
+"""
+Unit tests for the shared Google Text-to-Speech dispatch in podcastfy.tts.providers._google.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from podcastfy.tts.providers._google import _synthesize_async
+
+
+class FakeAsyncClient:
+    """Async client stand-in that records whether it was closed."""
+
+    instances = []
+
+    def __init__(self):
+        self.closed = False
+        FakeAsyncClient.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def synthesize_speech(self, text):
+        await asyncio.sleep(0)
+        return SimpleNamespace(audio_content=text.encode())
+
+
+def test_synthesize_async_closes_client_and_keeps_order():
+    FakeAsyncClient.instances.clear()
+    requests = [{"text": text} for text in ("a", "b", "c")]
+
+    audio = asyncio.run(_synthesize_async(FakeAsyncClient, requests, max_concurrency=2))
+
+    assert audio == [b"a", b"b", b"c"]
+    assert [client.closed for client in FakeAsyncClient.instances] == [True]
@@ -0,0 +1,96 @@
+"""
+Unit tests for the transcript markup helpers in podcastfy.templates._markup.
+"""
+
+import random
+import re
+
+from podcastfy.templates._markup import ensure_closed, strip_enclosed
+
+TAGS = ["Person1", "Person2"]
+
+
+def regex_ensure_closed(text: str, tags) -> str:
+    """The DOTALL regex that ensure_closed replaced."""
+    tag_pattern = "|".join(tags)
+    pattern = re.compile(f"<({tag_pattern})>(.*?)(?=<(?:{tag_pattern})>|$)", re.DOTALL)
+    return pattern.sub(r"<\1>\2</\1>", text)
+
+
+def test_ensure_closed_closes_each_block():
+    text = "<Person1>Hi there.<Person2>Hello!"
+    assert (
+        ensure_closed(text, TAGS)
+        == "<Person1>Hi there.</Person1><Person2>Hello!</Person2>"
+    )
+
+
+def test_ensure_closed_keeps_trailing_newline_outside():
+    assert ensure_closed("<Person1>Hi\n", TAGS) == "<Person1>Hi</Person1>\n"
+
+
+def test_ensure_closed_without_tags_is_unchanged():
+    text = "No tags here, just a < sign and <b>bold</b>."
+    assert ensure_closed(text, TAGS) is text
+
+
+def test_ensure_closed_ignores_unsupported_tags():
+    text = "<Person1>Hi <Person3>there"
+    assert ensure_closed(text, TAGS) == "<Person1>Hi <Person3>there</Person1>"
+
+
+def test_ensure_closed_matches_regex_on_random_input():
+    rng = random.Random(0)
+    pieces = [
+        "<Person1>",
+        "<Person2>",
+        "</Person1>",
+        "</Person2>",
+        "<Person3>",
+        "<emphasis>",
+        "<",
+        ">",
+        "\n",
+        "a",
+        "b c",
+        ".",
+    ]
+    for tags in (TAGS, ["Person1", "Person2", "emphasis"]):
+        for _ in range(500):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            assert ensure_closed(text, tags) == regex_ensure_closed(text, tags), text
+
+
+def test_strip_enclosed_removes_asides():
+    assert (
+        strip_enclosed("Well [laughs] that is [music fades] it.")
+        == "Well  that is  it."
+    )
+
+
+def test_strip_enclosed_removes_nested_groups_whole():
+    assert strip_enclosed("a [outer [inner] still] b") == "a  b"
+
+
+def test_strip_enclosed_leaves_unclosed_bracket():
+    assert strip_enclosed("a [stray b [x] c") == "a [stray b  c"
+    assert strip_enclosed("a [unbalanced [x] c") == "a [unbalanced  c"
+
+
+def test_strip_enclosed_requires_same_line():
+    text = "a [starts here\nends here] b"
+    assert strip_enclosed(text) is text
+
+
+def test_strip_enclosed_respects_max_span():
+    long_group = "[" + "x" * 498 + "]"
+    assert strip_enclosed("a" + long_group + "b") == "ab"
+    too_long = "[" + "x" * 499 + "]"
+    assert strip_enclosed("a" + too_long + "b") == "a" + too_long + "b"
+
+
+def test_strip_enclosed_handles_several_openers():
+    text = "Hi (pause) there [laughs] (and [nested] too)."
+    assert strip_enclosed(text, "[(") == "Hi  there  ."
+    assert strip_enclosed(text, "(") == "Hi  there [laughs] ."
+    assert strip_enclosed(text, "[") == "Hi (pause) there  (and  too)."
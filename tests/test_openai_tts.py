@@ -0,0 +1,40 @@
+"""
+Unit tests for turn handling in podcastfy.tts.providers.openai.
+"""
+
+import openai
+import pytest
+
+from podcastfy.tts.providers.openai import OpenAITTS
+from tests.test_audio_utils import audio_frame
+
+
+@pytest.fixture
+def tts(monkeypatch):
+    monkeypatch.setattr(openai, "api_key", "test-key")
+    provider = OpenAITTS()
+    provider.requests = []
+
+    def create_speech(requests):
+        provider.requests.extend(requests)
+        return [audio_frame(b"a") for _ in requests]
+
+    monkeypatch.setattr(provider, "_create_speech", create_speech)
+    return provider
+
+
+def test_blank_turns_are_not_sent(tts):
+    text = "<Person1>Hi.</Person1><Person2> </Person2><Person1>Again.</Person1><Person2>Yo</Person2>"
+    tts.generate_audio(text, voice="echo", voice2="nova")
+    assert [(r["voice"], r["input"]) for r in tts.requests] == [
+        ("echo", "Hi. Again."),
+        ("nova", "Yo"),
+    ]
+
+
+def test_only_blank_turns_raise(tts):
+    with pytest.raises(RuntimeError, match="No non-blank"):
+        tts.generate_audio(
+            "<Person1> </Person1><Person2>\n</Person2>", voice="echo", voice2="nova"
+        )
+    assert tts.requests == []
@@ -0,0 +1,37 @@
+"""
+Unit tests for transcript cleaning in the podcast templates.
+"""
+
+from podcastfy.templates import ConversationTemplate
+
+
+def test_clean_markup_merges_consecutive_turns_of_one_speaker():
+    text = "<Person1>Hi.</Person1>\n<Person1>Again.</Person1><Person2>Yo</Person2>"
+    assert (
+        ConversationTemplate().clean_markup(text)
+        == "<Person1>Hi. Again.</Person1> <Person2>Yo</Person2>"
+    )
+
+
+def test_clean_markup_removes_unsupported_markup():
+    text = "<Person1>Hi <b>bold</b> *there* [laughs]</Person1>text<Person2>ok"
+    assert (
+        ConversationTemplate().clean_markup(text)
+        == "<Person1>Hi bold there text</Person1> <Person2>ok</Person2>"
+    )
+
+
+def test_fix_malformed_tags_merges_nested_pairs_fully():
+    text = (
+        "<Person1><Person2>a</Person2></Person1><Person1><Person2>b</Person2></Person1>"
+    )
+    assert (
+        ConversationTemplate()._fix_malformed_tags(text)
+        == "<Person1><Person2>a b</Person2> </Person1>"
+    )
+
+
+def test_tag_patterns_are_shared_between_templates():
+    assert (
+        ConversationTemplate()._tag_patterns() is ConversationTemplate()._tag_patterns()
+    )
@@ -0,0 +1,38 @@
+"""
+Unit tests for podcastfy.utils.tracing.
+"""
+
+import langsmith
+
+from podcastfy.utils.tracing import maybe_traceable
+
+
+def test_maybe_traceable_checks_the_key_at_call_time(monkeypatch):
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+    monkeypatch.delenv("LANGCHAIN_API_KEY", raising=False)
+    traced_names = []
+
+    def fake_traceable(name, **kwargs):
+        def decorator(func):
+            def traced(*args, **call_kwargs):
+                traced_names.append(name)
+                return func(*args, **call_kwargs)
+
+            return traced
+
+        return decorator
+
+    monkeypatch.setattr(langsmith, "traceable", fake_traceable)
+
+    @maybe_traceable(name="double")
+    def double(value):
+        """Double a value."""
+        return value * 2
+
+    assert double(2) == 4
+    assert traced_names == []
+
+    monkeypatch.setenv("LANGSMITH_API_KEY", "key")
+    assert double(3) == 6
+    assert traced_names == ["double"]
+    assert double.__name__ == "double" and double.__doc__ == "Double a value."